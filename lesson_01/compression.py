@@ -0,0 +1,168 @@
+import bz2
+import gzip
+import io
+import lzma
+import os
+import re
+import struct
+import zlib
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+""" Transparent decompression for lesson_01 text tools
+
+Compression detected by magic bytes at the beginning of file, not by file extension.
+Supported: gzip, bzip2, xz (stdlib) and zstd (requires ``zstandard`` package).
+
+Gzip files which consist of many independent members (bgzip, ``gzip`` of concatenated chunks)
+could have index of members ``<filepath>.gzi`` in the BGZF format: little-endian uint64 number of entries
+followed by pairs of uint64 (compressed offset, uncompressed offset) of every member except first one.
+With the index file could be decompressed from the end member by member.
+"""
+
+GZIP, BZIP2, XZ, ZSTD = "gzip", "bzip2", "xz", "zstd"
+
+MAGIC = (
+    (b"\x1f\x8b", GZIP),
+    (b"\xfd7zXZ\x00", XZ),
+    (b"\x28\xb5\x2f\xfd", ZSTD),
+)
+# bzip2: "BZh", block size "1"-"9", magic of the first block (pi) or of the end of empty stream (sqrt(pi))
+BZIP2_RE = re.compile(rb"BZh[1-9](?:1AY&SY|\x17rE8P\x90)")
+MAGIC_SIZE = 10
+
+GZIP_INDEX_SUFFIX = ".gzi"
+GZIP_WBITS = 16 + zlib.MAX_WBITS
+GZIP_READ_SIZE = 1024 * 1024
+GZI_COUNT = struct.Struct("<Q")
+GZI_ENTRY = struct.Struct("<QQ")
+
+
+def detect_compression(filepath: str):
+    """ Detect compression of file ``filepath`` by magic bytes
+
+    Returns:
+        "gzip", "bzip2", "xz", "zstd" or None if file not compressed
+    """
+    with open(filepath, "rb") as f:
+        head = f.read(MAGIC_SIZE)
+    for magic, name in MAGIC:
+        if head.startswith(magic):
+            return name
+    if BZIP2_RE.match(head):
+        return BZIP2
+    return None
+
+
+def open_binary(filepath: str, compression: str = None):
+    """ Open file ``filepath`` for reading in binary mode with transparent stream decompression
+
+    Args:
+        filepath: path to file
+        compression: compression of file. Default None - detect by magic bytes
+
+    Returns:
+        binary file-like object which return decompressed data
+
+    Raises:
+        RuntimeError: if file compressed by zstd and ``zstandard`` package not installed
+    """
+    compression = compression or detect_compression(filepath)
+    if compression is None:
+        return open(filepath, "rb")
+    if compression == GZIP:
+        return gzip.open(filepath, "rb")
+    if compression == BZIP2:
+        return bz2.open(filepath, "rb")
+    if compression == XZ:
+        return lzma.open(filepath, "rb")
+    if zstandard is None:
+        raise RuntimeError(f"Install 'zstandard' package to read zstd compressed file {filepath!r}")
+    reader = zstandard.ZstdDecompressor().stream_reader(open(filepath, "rb"), read_across_frames=True)
+    return io.BufferedReader(reader)
+
+
+def gzip_index_path(filepath: str) -> str:
+    """ Path to gzip members index of ``filepath`` """
+    return filepath + GZIP_INDEX_SUFFIX
+
+
+def build_gzip_index(filepath: str) -> str:
+    """ Decompress gzip file ``filepath`` once and save offsets of its members next to the file
+
+    Returns:
+        path to index file
+    """
+    entries = []
+    uncompressed = 0
+    decompressor = zlib.decompressobj(GZIP_WBITS)
+    with open(filepath, "rb") as f:
+        data = f.read(GZIP_READ_SIZE)
+        while data:
+            uncompressed += len(decompressor.decompress(data))
+            if not decompressor.eof:
+                data = f.read(GZIP_READ_SIZE)
+                continue
+            data = decompressor.unused_data
+            member_end = f.tell() - len(data)
+            if not data:
+                data = f.read(GZIP_READ_SIZE)
+            if data:
+                entries.append((member_end, uncompressed))
+                decompressor = zlib.decompressobj(GZIP_WBITS)
+    path = gzip_index_path(filepath)
+    with open(path, "wb") as out:
+        out.write(GZI_COUNT.pack(len(entries)))
+        for entry in entries:
+            out.write(GZI_ENTRY.pack(*entry))
+    return path
+
+
+def load_gzip_index(filepath: str):
+    """ Load gzip members index of ``filepath``
+
+    Returns:
+        list of tuples (compressed offset, uncompressed offset) of every member including first one
+        or None if index not exists, older than file or file has only one member
+        (backward reading of one member would decompress whole file into memory)
+    """
+    path = gzip_index_path(filepath)
+    try:
+        if os.stat(path).st_mtime_ns < os.stat(filepath).st_mtime_ns:
+            return None
+        with open(path, "rb") as f:
+            data = f.read()
+        count, = GZI_COUNT.unpack_from(data)
+        entries = [GZI_ENTRY.unpack_from(data, GZI_COUNT.size + i * GZI_ENTRY.size) for i in range(count)]
+    except (OSError, struct.error):
+        return None
+    if not entries:
+        return None
+    return [(0, 0)] + entries
+
+
+def iter_gzip_members_backward(filepath: str, index: list):
+    """ Decompress members of gzip file ``filepath`` from the last one to the first one
+
+    Args:
+        filepath: path to gzip file
+        index: list of members offsets, see ``load_gzip_index``
+
+    Returns:
+        generator of decompressed data of members in reversed order
+    """
+    with open(filepath, "rb") as f:
+        end = f.seek(0, os.SEEK_END)
+        for start, _ in reversed(index):
+            f.seek(start)
+            data = f.read(end - start)
+            end = start
+            chunks = []
+            while data:
+                decompressor = zlib.decompressobj(GZIP_WBITS)
+                chunks.append(decompressor.decompress(data))
+                data = decompressor.unused_data
+            yield b"".join(chunks)
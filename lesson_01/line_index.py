@@ -0,0 +1,166 @@
+import array
+import mmap
+import os
+import struct
+import sys
+from itertools import islice
+
+from lesson_01.compression import detect_compression
+from lesson_01.utils import COUNT_BLOCK_SIZE, NEWLINE, iter_blocks, write_batched
+
+""" Persistent line offsets index for large immutable text files
+
+Index stored next to the file (``<filepath>.idx``) and contain header and ``array('Q')`` of offsets
+after every newline of the file. Index file mapped into memory, so line count, "lines N..M" and
+"last N lines" are resolved by O(1) lookups without loading of whole index.
+
+Index is valid only while size and modification time of the file are equal to saved ones.
+
+    >>> build_index("events.log")
+    >>> with LineIndex.load("events.log") as index:
+    ...     len(index)
+    ...     index.read_lines(100, 200)
+"""
+
+INDEX_SUFFIX = ".idx"
+MAGIC = b"LIDX"
+HEADER = struct.Struct("<4s?7xQQQ")  # magic, big endian offsets, file size, file mtime_ns, number of newlines
+
+
+def index_path(filepath: str) -> str:
+    """ Path to index file of ``filepath`` """
+    return filepath + INDEX_SUFFIX
+
+
+def build_index(filepath: str, block_size: int = COUNT_BLOCK_SIZE) -> str:
+    """ Scan file ``filepath`` once and save offsets of newlines next to the file
+
+    Args:
+        filepath: path to text file
+        block_size: size of block in bytes. Default 1 MiB
+
+    Returns:
+        path to index file
+
+    Raises:
+        ValueError: if file is compressed
+    """
+    if detect_compression(filepath) is not None:
+        raise ValueError(f"Cannot build line index of compressed file {filepath!r}")
+    path = index_path(filepath)
+    tmp_path = path + ".tmp"
+    count = 0
+    with open(filepath, "rb") as f, open(tmp_path, "wb") as out:
+        stat = os.fstat(f.fileno())
+        out.write(b"\0" * HEADER.size)
+        pos = 0
+        for block in iter_blocks(f, block_size=block_size):
+            offsets = array.array("Q")
+            idx = block.find(NEWLINE)
+            while idx != -1:
+                offsets.append(pos + idx + 1)
+                idx = block.find(NEWLINE, idx + 1)
+            offsets.tofile(out)
+            count += len(offsets)
+            pos += len(block)
+        out.seek(0)
+        out.write(HEADER.pack(MAGIC, sys.byteorder == "big", stat.st_size, stat.st_mtime_ns, count))
+    os.replace(tmp_path, path)
+    return path
+
+
+class LineIndex:
+    """ Memory mapped line offsets index of file """
+
+    def __init__(self, filepath: str, size: int, mm: mmap.mmap):
+        """ Initialize LineIndex object. Use ``LineIndex.load`` to open index
+
+        Args:
+            filepath: path to text file
+            size: size of text file
+            mm: memory mapped index file
+        """
+        self.filepath = filepath
+        self.size = size
+        self._mm = mm
+        self._offsets = memoryview(mm)[HEADER.size:].cast("Q")
+        last = self._offsets[-1] if len(self._offsets) else 0
+        self._lines = len(self._offsets) + (size > last)
+
+    @classmethod
+    def load(cls, filepath: str):
+        """ Open index of file ``filepath``
+
+        Returns:
+            LineIndex or None if index not exists or stale (file size or modification time changed)
+        """
+        try:
+            stat = os.stat(filepath)
+            with open(index_path(filepath), "rb") as f:
+                mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except (OSError, ValueError):
+            return None
+        try:
+            magic, big_endian, size, mtime_ns, count = HEADER.unpack_from(mm)
+        except struct.error:
+            mm.close()
+            return None
+        if (magic != MAGIC or big_endian != (sys.byteorder == "big") or size != stat.st_size
+                or mtime_ns != stat.st_mtime_ns or len(mm) != HEADER.size + count * 8):
+            mm.close()
+            return None
+        return cls(filepath, size, mm)
+
+    def close(self):
+        """ Close memory mapped index file """
+        self._offsets.release()
+        self._mm.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def __len__(self) -> int:
+        """ Number of lines in file. Last line without trailing newline counted too """
+        return self._lines
+
+    def line_offset(self, i: int) -> int:
+        """ Byte offset of beginning of line ``i`` (zero-based). Equal to file size if ``i`` >= number of lines """
+        if i <= 0:
+            return 0
+        if i >= self._lines:
+            return self.size
+        return self._offsets[i - 1]
+
+    def tail_offset(self, n: int) -> int:
+        """ Byte offset of beginning of last ``n`` lines """
+        return self.line_offset(self._lines - max(n, 0))
+
+    def iter_range(self, start: int, end: int, block_size: int = COUNT_BLOCK_SIZE):
+        """ Read bytes [``start``; ``end``) of file in blocks """
+        with open(self.filepath, "rb") as f:
+            yield from iter_blocks(f, start, end, block_size)
+
+    def read_lines(self, start: int, stop: int) -> bytes:
+        """ Read lines [``start``; ``stop``) (zero-based) of file """
+        return b"".join(self.iter_range(self.line_offset(start), self.line_offset(stop)))
+
+    def read_tail(self, n: int) -> bytes:
+        """ Read last ``n`` lines of file """
+        return b"".join(self.iter_range(self.tail_offset(n), self.size))
+
+
+def print_lines(filepath: str, start: int, stop: int):
+    """ Output lines [``start``; ``stop``) (zero-based) of file ``filepath`` to console
+
+    Index used if exists, otherwise file scanned from the beginning.
+    """
+    index = LineIndex.load(filepath)
+    if index is None:
+        with open(filepath, "rb") as f:
+            write_batched(islice(f, max(start, 0), max(stop, start, 0)))
+        return
+    with index:
+        write_batched(index.iter_range(index.line_offset(start), index.line_offset(stop)))
@@ -0,0 +1,183 @@
+import argparse
+import glob
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from functools import partial
+
+from lesson_01.compression import open_binary
+from lesson_01.utils import Counts, count_file, iter_head, write_batched
+
+""" Multi-file front end for lesson_01 text tools
+
+Expand globs and directories into list of files and run ``wc`` / ``head`` for every file
+by ``concurrent.futures`` workers. Results output in input order or in completion order.
+
+    python -m lesson_01.multi --workers 8 wc -l -w "/var/log/app/*.log"
+    python -m lesson_01.multi --executor processes --unordered head -n 5 /var/log/app
+"""
+
+EXECUTORS = {
+    "threads": ThreadPoolExecutor,
+    "processes": ProcessPoolExecutor,
+}
+
+
+def expand_paths(patterns, recursive: bool = False) -> list:
+    """ Expand globs and directories into list of files
+
+    Args:
+        patterns: iterable of paths, glob patterns or directories
+        recursive: walk directories recursively and allow ``**`` in patterns. Default False
+
+    Returns:
+        list of paths without duplicates in input order. Patterns which match nothing kept as is
+        to report error for them
+    """
+    paths = []
+    for pattern in patterns:
+        matches = sorted(glob.glob(pattern, recursive=recursive)) or [pattern]
+        for path in matches:
+            if not os.path.isdir(path):
+                paths.append(path)
+            elif recursive:
+                for root, dirs, files in os.walk(path):
+                    dirs.sort()
+                    paths.extend(os.path.join(root, name) for name in sorted(files))
+            else:
+                paths.extend(sorted(entry.path for entry in os.scandir(path) if entry.is_file()))
+    return list(dict.fromkeys(paths))
+
+
+def map_files(func, paths, workers: int = None, executor: str = "threads", ordered: bool = True):
+    """ Run ``func(path)`` for every path by pool of workers
+
+    Args:
+        func: function with one argument - path. Should be picklable for "processes" executor
+        paths: list of paths
+        workers: number of workers. Default None - number of processors
+        executor: type of workers "threads" or "processes". Default "threads"
+        ordered: return results in input order, otherwise in completion order. Default True
+
+    Returns:
+        generator of tuples (path, result, exception). ``exception`` is None if ``func`` succeeded
+    """
+    with EXECUTORS[executor](workers) as pool:
+        futures = {pool.submit(func, path): path for path in paths}
+        for future in (futures if ordered else as_completed(futures)):
+            try:
+                yield futures[future], future.result(), None
+            except Exception as ex:
+                yield futures[future], None, ex
+
+
+def read_head(path: str, n: int) -> bytes:
+    """ Read first ``n`` lines of file ``path`` """
+    with open_binary(path) as f:
+        return b"".join(iter_head(f, n))
+
+
+def error_message(tool: str, path: str, ex: Exception) -> str:
+    """ Format error the same manner as GNU tools do """
+    return f"{tool}: {path}: {getattr(ex, 'strerror', None) or ex}"
+
+
+def wc_files(patterns, lines: bool = True, words: bool = False, chars: bool = False, bytes_: bool = False,
+             workers: int = None, executor: str = "threads", ordered: bool = True, recursive: bool = False) -> Counts:
+    """ Count lines, words, characters and bytes of many files in parallel and print GNU ``wc`` style report
+
+    Every file printed as soon as it counted, ``total`` line printed if more than one file.
+
+    Args:
+        patterns: iterable of paths, glob patterns or directories
+        lines: print number of lines. Default True
+        words: print number of words. Default False
+        chars: print number of characters. Default False
+        bytes_: print number of bytes. Default False
+        workers: number of workers. Default None - number of processors
+        executor: type of workers "threads" or "processes". Default "threads"
+        ordered: print results in input order, otherwise in completion order. Default True
+        recursive: walk directories recursively. Default False
+
+    Returns:
+        Counts with totals
+    """
+    paths = expand_paths(patterns, recursive)
+    selected = [name for name, flag in zip(Counts._fields, (lines, words, chars, bytes_)) if flag]
+    sizes = sum(os.path.getsize(path) for path in paths if os.path.isfile(path))
+    width = len(str(sizes)) if len(paths) > 1 or len(selected) > 1 else 1
+    total = Counts(0, 0, 0, 0)
+
+    def output(counts, name):
+        print(" ".join("%*d" % (width, getattr(counts, field)) for field in selected), name, flush=True)
+
+    for path, counts, ex in map_files(partial(count_file, words=words, chars=chars), paths,
+                                      workers, executor, ordered):
+        if ex is not None:
+            print(error_message("wc", path, ex), file=sys.stderr)
+            continue
+        counts = counts._replace(words=counts.words or 0, chars=counts.chars or 0)
+        total = Counts(*map(sum, zip(total, counts)))
+        output(counts, path)
+    if len(paths) > 1:
+        output(total, "total")
+    return total
+
+
+def head_files(patterns, n: int = 10, workers: int = None, executor: str = "threads",
+               ordered: bool = True, recursive: bool = False):
+    """ Print first ``n`` lines of many files read in parallel, the same manner as GNU ``head`` does
+
+    Args:
+        patterns: iterable of paths, glob patterns or directories
+        n: number of lines. Integer great or equal zero. Default 10
+        workers: number of workers. Default None - number of processors
+        executor: type of workers "threads" or "processes". Default "threads"
+        ordered: print results in input order, otherwise in completion order. Default True
+        recursive: walk directories recursively. Default False
+    """
+    paths = expand_paths(patterns, recursive)
+    first = True
+    for path, data, ex in map_files(partial(read_head, n=n), paths, workers, executor, ordered):
+        if ex is not None:
+            print(error_message("head", path, ex), file=sys.stderr)
+            continue
+        if len(paths) > 1:
+            header = "==> %s <==\n" % path if first else "\n==> %s <==\n" % path
+            data = header.encode() + data
+            first = False
+        write_batched((data,))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Run lesson_01 text tools for many files in parallel")
+    parser.add_argument("--workers", type=int, default=None, help="Number of workers. Default number of processors")
+    parser.add_argument("--executor", choices=sorted(EXECUTORS), default="threads", help="Type of workers")
+    parser.add_argument("--unordered", action="store_true", help="Output results in completion order")
+    parser.add_argument("--recursive", action="store_true", help="Walk directories recursively")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    wc_parser = commands.add_parser("wc", help="Count lines, words, characters and bytes")
+    wc_parser.add_argument("-l", action="store_true", help="Print number of lines")
+    wc_parser.add_argument("-w", action="store_true", help="Print number of words")
+    wc_parser.add_argument("-m", action="store_true", help="Print number of characters")
+    wc_parser.add_argument("-c", action="store_true", help="Print number of bytes")
+    wc_parser.add_argument("paths", nargs="+", help="Files, glob patterns or directories")
+
+    head_parser = commands.add_parser("head", help="Print first lines of files")
+    head_parser.add_argument("-n", type=int, default=10, help="Number of lines. Default 10")
+    head_parser.add_argument("paths", nargs="+", help="Files, glob patterns or directories")
+
+    args = parser.parse_args(argv)
+    pool = dict(workers=args.workers, executor=args.executor, ordered=not args.unordered, recursive=args.recursive)
+    if args.command == "wc":
+        flags = (args.l, args.w, args.m, args.c)
+        if not any(flags):
+            flags = (True, True, False, True)
+        wc_files(args.paths, *flags, **pool)
+    else:
+        head_files(args.paths, args.n, **pool)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,7 +1,11 @@
 import os
 
+from lesson_01.compression import open_binary
+from lesson_01.line_index import LineIndex
+from lesson_01.utils import BLOCK_SIZE, iter_head, write_batched
 
-def head(filepath: str, n: int):
+
+def head(filepath: str, n: int, c: int = None, text: bool = False, block_size: int = BLOCK_SIZE):
     """ Read file ``filepath`` in text mode and print beginning ``n`` lines of file
 
     Requirements:
@@ -10,6 +14,33 @@ def head(filepath: str, n: int):
         3. If file ``filepath`` are empty than shouldn't output anything to console
         4. If ``n`` greater than actual lines than output to console whole file content
 
+    By default file read in binary blocks and written to ``sys.stdout.buffer`` as is, the same manner as GNU ``head``.
+    If line index of file exists (see ``lesson_01.line_index``) than end of ``n``-th line taken from index.
+    Compressed file decompressed as a stream and decompression stopped as soon as ``n`` lines are read.
+
+    :param filepath: path to text file
+    :param n: number of line to output. Integer great or equal zero
+    :param c: number of bytes to output instead of lines, the same manner as ``head -c``. Default None
+    :param text: read file in text mode and print stripped lines one by one. Default False
+    :param block_size: size of block in bytes. Default 64 KiB
+    """
+    if text:
+        return head_text(filepath, n)
+    index = LineIndex.load(filepath) if c is None else None
+    if index is not None:
+        with index:
+            write_batched(index.iter_range(0, index.line_offset(n), block_size))
+        return
+    with open_binary(filepath) as f:
+        if c is not None:
+            write_batched((f.read(c),))
+        elif n > 0:
+            write_batched(iter_head(f, n, block_size))
+
+
+def head_text(filepath: str, n: int):
+    """ Read file ``filepath`` in text mode and print beginning ``n`` stripped lines of file one by one
+
     :param filepath: path to text file
     :param n: number of line to output. Integer great or equal zero
     """
@@ -45,3 +76,10 @@ if __name__ == "__main__":
     # head -n 100500 blank.txt
     head(blank_path, 10)
     # but blank.txt is blank ¯\_(ツ)_/¯
+
+    # Should print first 100 bytes. Equal to GNU `head` command
+    # head -c 100 loreipsum.txt
+    head(loreipsum_path, 0, c=100)
+
+    # Should print first 10 stripped lines one by one
+    head(loreipsum_path, 10, text=True)
@@ -1,4 +1,10 @@
-def tail(filepath: str, n: int):
+import os
+
+from lesson_01.line_index import LineIndex
+from lesson_01.utils import BLOCK_SIZE, follow as follow_lines, read_tail
+
+
+def tail(filepath: str, n: int, follow: bool = False, interval: float = 1.0, block_size: int = BLOCK_SIZE):
     """ Read file ``filepath`` in text mode and print endings ``n`` lines of file
 
     Requirements:
@@ -8,25 +14,35 @@ def tail(filepath: str, n: int):
         4. If ``n`` greater than actual lines than output to console whole file content
         5. Output in the order of data in the file
 
+    File read backward from the end in blocks of ``block_size`` bytes until ``n`` lines found,
+    so only last ``n`` lines are read from disk. If line index of file exists (see ``lesson_01.line_index``)
+    than beginning of last ``n`` lines taken from index. Compressed file decompressed on the fly,
+    gzip file with members index decompressed backward from the end (see ``lesson_01.compression``).
+
     :param filepath: path to text file
     :param n: number of line to output. Integer great or equal zero
+    :param follow: output appended data as the file grows, the same manner as ``tail -f``. Default False
+    :param interval: polling interval in seconds for ``follow`` mode. Default 1.0
+    :param block_size: size of block in bytes. Default 64 KiB
     """
-    try:
-        length = len(open(filepath).readlines())
-    except (FileNotFoundError, IsADirectoryError):
+    if not os.path.isfile(filepath):
         print(f'tail: cannot open {filepath} for reading: No such file or directory')
         return None
-    if n > 0 or os.stat(filepath).st_size != 0:
-        with open(filepath, 'r') as f:
-            for i in range(length):
-                line = next(f).strip()
-                if i >= length - n:
-                    print(line)
+    if follow:
+        for line in follow_lines(filepath, n, interval, block_size):
+            print(line.decode().strip(), flush=True)
+        return None
+    index = LineIndex.load(filepath)
+    if index is not None:
+        with index:
+            data = index.read_tail(n)
+    else:
+        data = read_tail(filepath, n, block_size)
+    for line in data.decode().splitlines():
+        print(line.strip())
 
 
 if __name__ == "__main__":
-    import os
-
     ROOT = os.path.dirname(__file__)
 
     loreipsum_path = os.path.join(ROOT, "loreipsum.txt")
@@ -0,0 +1,75 @@
+""" Compare list based ``tac`` with streaming ``tac``
+
+Generates text file of selected size and measures execution time and peak memory allocated by Python
+(``tracemalloc``) for both implementations. Output of ``tac`` redirected to /dev/null.
+
+    python -m lesson_01.task_3.benchmark --size 1024
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+
+from lesson_01.task_3.main import tac
+
+LINE = b"Lorem ipsum dolor sit amet, consectetur adipiscing elit.\n"
+
+
+def tac_list(filepath: str):
+    """ Previous implementation: load every stripped line into list before reversing """
+    lines = []
+    if os.stat(filepath).st_size != 0:
+        with open(filepath, 'r') as f:
+            lines = [line.strip() for line in f]
+    for i in reversed(lines):
+        print(i)
+
+
+def generate_file(filepath: str, size: int):
+    """ Write ``size`` bytes of text lines into ``filepath`` """
+    chunk = LINE * (1024 * 1024 // len(LINE))
+    with open(filepath, "wb") as f:
+        while size > 0:
+            f.write(chunk[:size])
+            size -= len(chunk)
+
+
+def measure(func, filepath: str):
+    """ Run ``func(filepath)`` with stdout redirected to /dev/null
+
+    Returns:
+        tuple (seconds, peak allocated bytes)
+    """
+    stdout = sys.stdout
+    with open(os.devnull, "w") as devnull:
+        sys.stdout = devnull
+        tracemalloc.start()
+        start = time.perf_counter()
+        try:
+            func(filepath)
+        finally:
+            elapsed = time.perf_counter() - start
+            _, peak = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+            sys.stdout = stdout
+    return elapsed, peak
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--size", type=int, default=1024, help="Size of generated file in MiB. Default 1024")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        filepath = os.path.join(tmp, "tac.txt")
+        generate_file(filepath, args.size * 1024 * 1024)
+        for name, func in (("streaming", tac), ("list", tac_list)):
+            elapsed, peak = measure(func, filepath)
+            print("%-10s %10.3f sec %12.1f MiB peak" % (name, elapsed, peak / 1024 / 1024))
+
+
+if __name__ == "__main__":
+    main()
@@ -1,4 +1,33 @@
-def tac(filepath: str):
+import os
+import shutil
+import tempfile
+
+from lesson_01.compression import detect_compression, open_binary
+from lesson_01.utils import BLOCK_SIZE, WRITE_BATCH_SIZE, iter_records_backward, write_batched
+
+
+def iter_tac(filepath: str, separator: str = "\n", block_size: int = BLOCK_SIZE):
+    """ Read file ``filepath`` from the end in blocks and return records in reversing order
+
+    Compressed file decompressed into temporary file before reading backward.
+
+    :param filepath: path to text file
+    :param separator: records separator, the same manner as GNU ``tac -s``. Default newline
+    :param block_size: size of block in bytes. Default 64 KiB
+    :return generator of records (bytes) with trailing separator
+    """
+    compression = detect_compression(filepath)
+    if compression is None:
+        with open(filepath, "rb") as f:
+            yield from iter_records_backward(f, separator.encode(), block_size)
+        return
+    # Compressed stream cannot be read backward, so decompress it into temporary file first
+    with open_binary(filepath, compression) as src, tempfile.TemporaryFile() as f:
+        shutil.copyfileobj(src, f, block_size)
+        yield from iter_records_backward(f, separator.encode(), block_size)
+
+
+def tac(filepath: str, separator: str = "\n", block_size: int = BLOCK_SIZE, batch_size: int = WRITE_BATCH_SIZE):
     """ Read file ``filepath`` in text mode and reversing the records (lines by default) in each separately
 
     Requirements:
@@ -6,19 +35,19 @@ def tac(filepath: str):
         2. If file ``filepath`` are empty than shouldn't output anything to console
         3. Lines content should output in direct order (not reversed)
 
+    File never loaded into memory: it read backward in blocks of ``block_size`` bytes
+    and records written to ``sys.stdout.buffer`` by batches of ``batch_size`` bytes.
+
     :param filepath: path to text file
+    :param separator: records separator, the same manner as GNU ``tac -s``. Default newline
+    :param block_size: size of block in bytes. Default 64 KiB
+    :param batch_size: minimal size of one write to console in bytes. Default 256 KiB
     """
-    lines = []
     if os.stat(filepath).st_size != 0:
-        with open(filepath, 'r') as f:
-            lines = [line.strip() for line in f]
-    for i in reversed(lines):
-        print(i)
+        write_batched(iter_tac(filepath, separator, block_size), batch_size=batch_size)
 
 
 if __name__ == "__main__":
-    import os
-
     ROOT = os.path.dirname(__file__)
 
     loreipsum_path = os.path.join(ROOT, "loreipsum.txt")
@@ -31,3 +60,7 @@ if __name__ == "__main__":
     # Should print nothing (file is empty). Equal to GNU `tac` command
     # tac blank.txt
     tac(blank_path)
+
+    # Should print records separated by ". " in reversed order. Equal to GNU `tac` command
+    # tac -s ". " loreipsum.txt
+    tac(loreipsum_path, separator=". ")
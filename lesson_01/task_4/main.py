@@ -1,10 +1,55 @@
-def nl(filepath: str, v: int = 1, s: str = "\t\t"):
+import os
+
+from lesson_01.utils import BLOCK_SIZE, NEWLINE, iter_blocks, write_batched
+
+
+def nl(filepath: str, v: int = 1, s: str = "\t\t", w: int = 1, text: bool = False, block_size: int = BLOCK_SIZE):
     """ Read file ``filepath`` in text mode, numbering lines and output with original line
 
     Requirements:
         1. Open file ``filepath`` in text mode and output to console number of line + separator + original line
         2. If file ``filepath`` are empty than shouldn't output anything to console
 
+    By default file read in binary blocks, lines numbered by one format string built once
+    and output written to ``sys.stdout.buffer`` by one call per block.
+
+    :param filepath: path to text file
+    :param v: first line number
+    :param s: separator between number and line
+    :param w: width of line number, the same manner as ``nl -w``. Default 1
+    :param text: read file in text mode and print stripped lines one by one. Default False
+    :param block_size: size of block in bytes. Default 64 KiB
+    """
+    if text:
+        return nl_text(filepath, v, s)
+    with open(filepath, 'rb') as f:
+        write_batched(iter_numbered(iter_blocks(f, block_size=block_size), v, s, w), batch_size=block_size)
+
+
+def iter_numbered(blocks, v: int = 1, s: str = "\t\t", w: int = 1):
+    """ Numbering lines of binary ``blocks``
+
+    :param blocks: iterable of bytes
+    :param v: first line number
+    :param s: separator between number and line
+    :param w: width of line number
+    :return generator of bytes, one per block
+    """
+    prefix = ("%" + str(w) + "d").encode() + s.encode().replace(b"%", b"%%")
+    pending = b""
+    for block in blocks:
+        lines = (pending + block).split(NEWLINE)
+        pending = lines.pop()
+        if lines:
+            yield b"".join([prefix % i + line + NEWLINE for i, line in enumerate(lines, v)])
+            v += len(lines)
+    if pending:
+        yield prefix % v + pending + NEWLINE
+
+
+def nl_text(filepath: str, v: int = 1, s: str = "\t\t"):
+    """ Read file ``filepath`` in text mode and print numbered stripped lines one by one
+
     :param filepath: path to text file
     :param v: first line number
     :param s: separator between number and line
@@ -18,8 +63,6 @@ def nl(filepath: str, v: int = 1, s: str = "\t\t"):
 
 
 if __name__ == "__main__":
-
-    import os
     ROOT = os.path.dirname(__file__)
 
     loreipsum_path = os.path.join(ROOT, "loreipsum.txt")
@@ -1,20 +1,52 @@
-def wc(filepath: str):
+from lesson_01.line_index import LineIndex
+from lesson_01.utils import COUNT_BLOCK_SIZE, Counts, count_file
+
+
+def wc(filepath: str, workers: int = 1, use_mmap: bool = False, block_size: int = COUNT_BLOCK_SIZE):
     """ Read file ``filepath`` in text mode count lines
 
     Requirements:
         1. Open file ``filepath`` in text mode count number of lines in file
         2. If file ``filepath`` are empty than number than return 0
 
+    File read in binary blocks and newlines counted by ``bytes.count``, lines are not materialised.
+    Last line without trailing newline counted too, the same manner as ``len(f.readlines())`` does.
+    If line index of file exists (see ``lesson_01.line_index``) than number of lines taken from index.
+    Compressed file counted on decompressed blocks.
+
     :param filepath: path to text file
+    :param workers: number of processes to count byte ranges of file in parallel. Default 1
+    :param use_mmap: read file through ``mmap.mmap``. Default False
+    :param block_size: size of block in bytes. Default 1 MiB
     :return Number of lines in file
     """
+    index = LineIndex.load(filepath)
+    if index is not None:
+        with index:
+            return len(index)
     try:
-        length = len(open(filepath).readlines())
-        return length
+        return count_file(filepath, workers=workers, use_mmap=use_mmap, block_size=block_size, partial_line=True).lines
     except (FileNotFoundError, IsADirectoryError):
         return f'wc: cannot open {filepath} for reading: No such file or directory'
 
 
+def wc_counts(filepath: str, c: bool = False, w: bool = False, m: bool = False, workers: int = 1,
+              use_mmap: bool = False, block_size: int = COUNT_BLOCK_SIZE) -> Counts:
+    """ Count lines, words (``-w``), characters (``-m``) and bytes (``-c``) of file ``filepath`` in one pass
+
+    :param filepath: path to text file
+    :param c: count bytes. Default False
+    :param w: count words. Default False
+    :param m: count characters (UTF-8). Default False
+    :param workers: number of processes to count byte ranges of file in parallel. Default 1
+    :param use_mmap: read file through ``mmap.mmap``. Default False
+    :param block_size: size of block in bytes. Default 1 MiB
+    :return Counts(lines, words, chars, bytes). Counts which are not requested are None
+    """
+    counts = count_file(filepath, words=w, chars=m, workers=workers, use_mmap=use_mmap, block_size=block_size)
+    return counts if c else counts._replace(bytes=None)
+
+
 if __name__ == "__main__":
     import os
     ROOT = os.path.dirname(__file__)
@@ -29,3 +61,7 @@ if __name__ == "__main__":
     # Should print whole file with numbers of lines with separator ": ". Equal to GNU `wc` command
     # cat blank.txt | wc -l
     print(wc(blank_path))
+
+    # Should print number of lines, words, characters and bytes. Equal to GNU `wc` command
+    # wc -l -w -m -c loreipsum.txt
+    print(wc_counts(loreipsum_path, c=True, w=True, m=True))
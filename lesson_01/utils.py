@@ -0,0 +1,428 @@
+import mmap
+import os
+import sys
+import time
+from collections import deque, namedtuple
+from concurrent.futures import ProcessPoolExecutor
+
+from lesson_01.compression import GZIP, detect_compression, iter_gzip_members_backward, load_gzip_index, open_binary
+
+""" Shared binary helpers for lesson_01 text tools
+
+Files are opened in binary mode and read in fixed-size blocks, so the cost of an operation
+depends on the amount of output and not on the size of the file.
+Compressed files (see ``lesson_01.compression``) are decompressed on the fly.
+"""
+
+BLOCK_SIZE = 64 * 1024
+WRITE_BATCH_SIZE = 256 * 1024
+COUNT_BLOCK_SIZE = 1024 * 1024
+NEWLINE = b"\n"
+WHITESPACE = b" \t\n\r\x0b\x0c"
+UTF8_CONTINUATION = bytes(range(0x80, 0xC0))
+
+Counts = namedtuple("Counts", ("lines", "words", "chars", "bytes"))
+
+
+def iter_blocks_backward(f, end: int, block_size: int = BLOCK_SIZE):
+    """ Read binary file-like object ``f`` in blocks from ``end`` to the beginning
+
+    Args:
+        f: seekable binary file-like object
+        end: byte offset to start reading backward from (usually size of file)
+        block_size: size of block in bytes. Default 64 KiB
+
+    Returns:
+        generator of tuples (offset, block) in reversed order
+    """
+    pos = end
+    while pos > 0:
+        size = min(block_size, pos)
+        pos -= size
+        f.seek(pos)
+        yield pos, f.read(size)
+
+
+def tail_offset(f, n: int, block_size: int = BLOCK_SIZE) -> int:
+    """ Find byte offset where last ``n`` lines of binary file-like object ``f`` begin
+
+    A trailing newline at the end of file doesn't start new line, the same manner as GNU ``tail`` does.
+
+    Args:
+        f: seekable binary file-like object
+        n: number of lines. Integer great or equal zero
+        block_size: size of block in bytes. Default 64 KiB
+
+    Returns:
+        byte offset. Equal to size of file if ``n`` == 0 and 0 if file contain less than ``n`` lines
+    """
+    size = f.seek(0, os.SEEK_END)
+    if n <= 0 or size == 0:
+        return size
+    end = size
+    f.seek(size - 1)
+    if f.read(1) == NEWLINE:
+        end -= 1
+    for pos, block in iter_blocks_backward(f, end, block_size):
+        count = block.count(NEWLINE)
+        if count < n:
+            n -= count
+            continue
+        idx = len(block)
+        for _ in range(n):
+            idx = block.rindex(NEWLINE, 0, idx)
+        return pos + idx + 1
+    return 0
+
+
+def iter_records_backward(f, separator: bytes = NEWLINE, block_size: int = BLOCK_SIZE):
+    """ Read records of binary file-like object ``f`` from the end of file to the beginning
+
+    Records are separated by ``separator`` which kept at the end of record, the same manner as GNU ``tac`` does.
+    Separators matched from the end of file, so records of overlapping separator split the same way
+    (``axxxb`` with separator ``xx`` is ``axxx`` + ``b``) independent of ``block_size``.
+    Only current block and incomplete record held in memory.
+
+    Args:
+        f: seekable binary file-like object
+        separator: records separator. Bytes. Default newline
+        block_size: size of block in bytes. Default 64 KiB
+
+    Returns:
+        generator of records (bytes) in reversed order
+    """
+    if not separator:
+        raise ValueError("separator cannot be empty")
+    size = f.seek(0, os.SEEK_END)
+    sep_len = len(separator)
+    buf = b""
+    # Separators in ``buf`` end at or before ``limit``: later ones are found or overlap found one
+    limit = 0
+    for _, block in iter_blocks_backward(f, size, block_size):
+        buf = block + buf
+        # Incomplete record has no separator before ``limit``, so new separator starts in new block.
+        # rsplit() matches separators from the right end, so overlapping ones are chosen as GNU tac does
+        limit = len(block) + min(limit, sep_len - 1)
+        records = buf[:limit].rsplit(separator)
+        if len(records) == 1:
+            continue
+        last = records.pop() + buf[limit:]
+        if last:
+            yield last
+        for record in reversed(records[1:]):
+            yield record + separator
+        buf = records[0] + separator
+        limit = len(records[0])
+    if buf:
+        yield buf
+
+
+def write_batched(chunks, stream=None, batch_size: int = WRITE_BATCH_SIZE):
+    """ Join ``chunks`` of bytes and write them to binary ``stream`` by batches of at least ``batch_size`` bytes
+
+    Args:
+        chunks: iterable of bytes
+        stream: binary file-like object. Default None - ``sys.stdout.buffer``
+        batch_size: minimal size of one write in bytes. Default 256 KiB
+    """
+    if stream is None:
+        sys.stdout.flush()
+        stream = sys.stdout.buffer
+    batch, size = [], 0
+    for chunk in chunks:
+        batch.append(chunk)
+        size += len(chunk)
+        if size >= batch_size:
+            stream.write(b"".join(batch))
+            batch, size = [], 0
+    if batch:
+        stream.write(b"".join(batch))
+    stream.flush()
+
+
+def iter_head(f, n: int, block_size: int = BLOCK_SIZE):
+    """ Read first ``n`` lines of binary file-like object ``f`` in blocks
+
+    Args:
+        f: binary file-like object
+        n: number of lines. Integer great or equal zero
+        block_size: size of block in bytes. Default 64 KiB
+
+    Returns:
+        generator of bytes. Last block cut after ``n``-th newline
+    """
+    while n > 0:
+        block = f.read(block_size)
+        if not block:
+            return
+        count = block.count(NEWLINE)
+        if count >= n:
+            idx = -1
+            for _ in range(n):
+                idx = block.index(NEWLINE, idx + 1)
+            yield block[:idx + 1]
+            return
+        n -= count
+        yield block
+
+
+def tail_from_blocks(blocks, n: int) -> bytes:
+    """ Find last ``n`` lines in ``blocks`` of data read from the end to the beginning
+
+    Args:
+        blocks: iterable of bytes in reversed order (the last block of data first)
+        n: number of lines. Integer great or equal zero
+
+    Returns:
+        bytes with last ``n`` lines
+    """
+    parts = []
+    trailing = True
+    for block in blocks:
+        if n <= 0:
+            break
+        end = len(block)
+        if trailing and end:
+            end -= block.endswith(NEWLINE)
+            trailing = False
+        count = block.count(NEWLINE, 0, end)
+        if count >= n:
+            for _ in range(n):
+                end = block.rindex(NEWLINE, 0, end)
+            parts.append(block[end + 1:])
+            break
+        n -= count
+        parts.append(block)
+    return b"".join(reversed(parts))
+
+
+def read_tail(filepath: str, n: int, block_size: int = BLOCK_SIZE) -> bytes:
+    """ Read last ``n`` lines of file ``filepath`` in binary mode
+
+    Plain file read backward from the end. Gzip file with members index (see ``lesson_01.compression``)
+    decompressed backward member by member, other compressed files decompressed as a stream
+    while only last ``n`` lines are kept in memory.
+
+    Args:
+        filepath: path to file
+        n: number of lines. Integer great or equal zero
+        block_size: size of block in bytes. Default 64 KiB
+
+    Returns:
+        bytes with last ``n`` lines
+    """
+    compression = detect_compression(filepath)
+    if compression is None:
+        with open(filepath, "rb") as f:
+            f.seek(tail_offset(f, n, block_size))
+            return f.read()
+    index = load_gzip_index(filepath) if compression == GZIP else None
+    if index is not None:
+        return tail_from_blocks(iter_gzip_members_backward(filepath, index), n)
+    # Blocks with number of newlines in them. Oldest block dropped as soon as the rest of blocks
+    # contain more than ``n`` newlines, so one of them is the beginning of last ``n`` lines
+    blocks = deque()
+    count = 0
+    with open_binary(filepath, compression) as f:
+        for block in iter_blocks(f, block_size=block_size):
+            newlines = block.count(NEWLINE)
+            blocks.append((newlines, block))
+            count += newlines
+            while len(blocks) > 1 and count - blocks[0][0] > n:
+                count -= blocks.popleft()[0]
+    return tail_from_blocks((block for _, block in reversed(blocks)), n)
+
+
+def follow(filepath: str, n: int = 10, interval: float = 1.0, block_size: int = BLOCK_SIZE):
+    """ Output appended lines of file ``filepath`` as the file grows, the same manner as ``tail -f``
+
+    File checked by polling ``os.fstat`` every ``interval`` seconds, only new data read from file.
+    If file was truncated than reading continue from the beginning of file.
+    Incomplete last line held back until newline appended.
+
+    Args:
+        filepath: path to file
+        n: number of last lines to output before following. Integer great or equal zero
+        interval: polling interval in seconds. Default 1.0
+        block_size: size of block in bytes. Default 64 KiB
+
+    Returns:
+        infinity generator of lines (bytes, with trailing newline)
+
+    Raises:
+        ValueError: if file is compressed
+    """
+    if detect_compression(filepath) is not None:
+        raise ValueError(f"Cannot follow compressed file {filepath!r}")
+    with open(filepath, "rb") as f:
+        pos = tail_offset(f, n, block_size)
+        f.seek(pos)
+        pending = b""
+        while True:
+            size = os.fstat(f.fileno()).st_size
+            if size < pos:
+                f.seek(0)
+                pos, pending = 0, b""
+            if size == pos:
+                time.sleep(interval)
+                continue
+            data = f.read(min(size - pos, block_size))
+            pos += len(data)
+            data = pending + data
+            last = data.rfind(NEWLINE) + 1
+            pending = data[last:]
+            start = 0
+            while start < last:
+                end = data.index(NEWLINE, start) + 1
+                yield data[start:end]
+                start = end
+
+
+def iter_blocks(f, start: int = None, end: int = None, block_size: int = BLOCK_SIZE):
+    """ Read binary file-like object ``f`` in blocks from ``start`` to ``end``
+
+    Args:
+        f: binary file-like object or mmap.mmap
+        start: byte offset to start reading from. Default None - current position, for not seekable streams
+        end: byte offset to stop reading at. Default None - till the end of file
+        block_size: size of block in bytes. Default 64 KiB
+
+    Returns:
+        generator of bytes
+    """
+    if start is not None:
+        f.seek(start)
+    pos = start or 0
+    while end is None or pos < end:
+        block = f.read(block_size if end is None else min(block_size, end - pos))
+        if not block:
+            return
+        pos += len(block)
+        yield block
+
+
+def count_range(filepath: str, start: int = 0, end: int = None, words: bool = False, chars: bool = False,
+                use_mmap: bool = False, block_size: int = COUNT_BLOCK_SIZE) -> Counts:
+    """ Count lines, words, characters and bytes of file ``filepath`` in byte range [``start``; ``end``)
+
+    Lines counted as number of newlines, words as number of sequences of non whitespace bytes
+    which begin inside the range, characters as number of UTF-8 characters.
+    No lines materialised, every block processed by ``bytes.count`` / ``bytes.split`` / ``bytes.translate``.
+
+    Args:
+        filepath: path to file
+        start: byte offset to start counting from. Default 0
+        end: byte offset to stop counting at. Default None - till the end of file
+        words: count words. Default False
+        chars: count characters. Default False
+        use_mmap: read file through ``mmap.mmap`` rather than ``read()`` calls. Default False
+        block_size: size of block in bytes. Default 1 MiB
+
+    Returns:
+        Counts. ``words`` / ``chars`` are None if not requested
+    """
+    with open(filepath, "rb") as f:
+        if use_mmap and os.fstat(f.fileno()).st_size > 0:
+            f = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        with f:
+            in_word = False
+            if words and start > 0:
+                f.seek(start - 1)
+                in_word = f.read(1) not in WHITESPACE
+            return count_blocks(iter_blocks(f, start, end, block_size), words, chars, in_word)
+
+
+def count_blocks(blocks, words: bool = False, chars: bool = False, in_word: bool = False) -> Counts:
+    """ Count lines, words, characters and bytes of ``blocks`` of bytes
+
+    Args:
+        blocks: iterable of bytes
+        words: count words. Default False
+        chars: count characters. Default False
+        in_word: data before the first block ends inside of word. Default False
+
+    Returns:
+        Counts. ``words`` / ``chars`` are None if not requested
+    """
+    lines = words_count = chars_count = size = 0
+    for block in blocks:
+        size += len(block)
+        lines += block.count(NEWLINE)
+        if words:
+            words_count += len(block.split())
+            if in_word and block[:1] not in WHITESPACE:
+                words_count -= 1
+            in_word = block[-1:] not in WHITESPACE
+        if chars:
+            chars_count += len(block.translate(None, UTF8_CONTINUATION))
+    return Counts(lines, words_count if words else None, chars_count if chars else None, size)
+
+
+def split_ranges(size: int, parts: int, min_size: int = COUNT_BLOCK_SIZE):
+    """ Split ``size`` bytes into at most ``parts`` byte ranges not smaller than ``min_size``
+
+    Returns:
+        list of tuples (start, end)
+    """
+    step = max(-(-size // max(parts, 1)), min_size)
+    return [(start, min(start + step, size)) for start in range(0, size, step)]
+
+
+def count_file(filepath: str, words: bool = False, chars: bool = False, workers: int = 1,
+               use_mmap: bool = False, block_size: int = COUNT_BLOCK_SIZE, partial_line: bool = False) -> Counts:
+    """ Count lines, words, characters and bytes of file ``filepath`` in one pass
+
+    Lines counted as number of newlines, the same manner as GNU ``wc -l`` does. If ``partial_line`` is True
+    than last line without trailing newline counted too, the same manner as ``len(f.readlines())`` does.
+
+    If ``workers`` > 1 than file split into byte ranges which counted in parallel
+    by ``concurrent.futures.ProcessPoolExecutor``.
+    Compressed file counted on decompressed blocks by one process, ``workers`` and ``use_mmap`` are ignored.
+
+    Args:
+        filepath: path to file
+        words: count words. Default False
+        chars: count characters. Default False
+        workers: number of processes. Default 1
+        use_mmap: read file through ``mmap.mmap`` rather than ``read()`` calls. Default False
+        block_size: size of block in bytes. Default 1 MiB
+        partial_line: count last line without trailing newline. Default False
+
+    Returns:
+        Counts. ``words`` / ``chars`` are None if not requested
+    """
+    if detect_compression(filepath) is not None:
+        with open_binary(filepath) as f:
+            blocks = iter_blocks(f, block_size=block_size)
+            if not partial_line:
+                return count_blocks(blocks, words, chars)
+            last = [b""]
+
+            def remember_last(blocks):
+                for block in blocks:
+                    last[0] = block
+                    yield block
+
+            counts = count_blocks(remember_last(blocks), words, chars)
+            return counts._replace(lines=counts.lines + (last[0][-1:] not in (b"", NEWLINE)))
+    ranges = split_ranges(os.stat(filepath).st_size, workers, block_size)
+    if workers <= 1 or len(ranges) <= 1:
+        counts = count_range(filepath, 0, None, words, chars, use_mmap, block_size)
+    else:
+        with ProcessPoolExecutor(workers) as executor:
+            futures = [
+                executor.submit(count_range, filepath, start, end, words, chars, use_mmap, block_size)
+                for start, end in ranges
+            ]
+            results = [future.result() for future in futures]
+        counts = Counts(
+            sum(r.lines for r in results),
+            sum(r.words for r in results) if words else None,
+            sum(r.chars for r in results) if chars else None,
+            sum(r.bytes for r in results),
+        )
+    if partial_line and counts.bytes:
+        with open(filepath, "rb") as f:
+            f.seek(counts.bytes - 1)
+            counts = counts._replace(lines=counts.lines + (f.read(1) != NEWLINE))
+    return counts
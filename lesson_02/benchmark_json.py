@@ -0,0 +1,90 @@
+""" Compare ``json_dumps`` / ``json_dump`` from lesson_02 task_2 with stock ``json.dumps`` / ``json.dump``
+
+Payloads contain only types supported by stock ``json`` module, so both encoders produce the same output.
+Decimal-heavy rows compare float and raw (``use_decimal=True``) encoding of Decimal and decoding back.
+
+    python -m lesson_02.benchmark_json --records 100000
+"""
+
+import argparse
+import io
+import json
+import timeit
+from decimal import Decimal
+
+from lesson_02.tasks.task_2 import json_dump, json_dumps, json_loads
+
+
+def small_records(n: int) -> list:
+    """ ``n`` small flat records """
+    return [
+        {"id": i, "name": "user%d" % i, "active": i % 2 == 0, "score": i / 7, "tags": ["a", "b"], "parent": None}
+        for i in range(n)
+    ]
+
+
+def nested_payload(n: int) -> dict:
+    """ Large nested payload with ``n`` records at the bottom """
+    return {"meta": {"count": n, "source": "benchmark"}, "data": {"users": small_records(n), "total": n}}
+
+
+def decimal_records(n: int) -> list:
+    """ ``n`` records with monetary Decimal values """
+    return [
+        {"id": i, "price": Decimal("%d.%02d" % (i, i % 100)), "tax": Decimal("0.%04d" % (i % 10000)),
+         "total": Decimal("%d.%06d" % (i * 3, i % 1000000))}
+        for i in range(n)
+    ]
+
+
+def dump_stock(obj):
+    json.dump(obj, io.StringIO())
+
+
+def dump_extended(obj):
+    json_dump(obj, io.StringIO())
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--records", type=int, default=100000, help="Number of records. Default 100000")
+    parser.add_argument("--repeat", type=int, default=3, help="Number of repeats. Default 3")
+    args = parser.parse_args()
+
+    payloads = {
+        "small records": small_records(args.records),
+        "nested payload": nested_payload(args.records),
+    }
+    functions = {
+        "json.dumps": json.dumps,
+        "json_dumps": json_dumps,
+        "json.dump": dump_stock,
+        "json_dump": dump_extended,
+    }
+    for payload_name, payload in payloads.items():
+        assert json_dumps(payload) == json.dumps(payload)
+        for func_name, func in functions.items():
+            elapsed = min(timeit.repeat(lambda: func(payload), number=1, repeat=args.repeat))
+            print("%-15s %-20s %8.3f sec" % (payload_name, func_name, elapsed))
+
+    records = payloads["small records"]
+    for func_name, func in (("json.dumps", json.dumps), ("json_dumps", json_dumps)):
+        elapsed = min(timeit.repeat(lambda: [func(record) for record in records], number=1, repeat=args.repeat))
+        print("%-15s %-20s %8.3f sec" % ("per record", func_name, elapsed))
+
+    records = decimal_records(args.records)
+    encoded = json_dumps(records, use_decimal=True)
+    assert json_loads(encoded, use_decimal=True) == records
+    functions = {
+        "encode float": lambda: json_dumps(records),
+        "encode raw": lambda: json_dumps(records, use_decimal=True),
+        "decode float": lambda: json_loads(encoded),
+        "decode Decimal": lambda: json_loads(encoded, use_decimal=True),
+    }
+    for func_name, func in functions.items():
+        elapsed = min(timeit.repeat(func, number=1, repeat=args.repeat))
+        print("%-15s %-20s %8.3f sec" % ("decimal rows", func_name, elapsed))
+
+
+if __name__ == "__main__":
+    main()
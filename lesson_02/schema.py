@@ -0,0 +1,227 @@
+import re
+from datetime import date, datetime
+from decimal import Decimal
+from itertools import chain, islice
+
+""" Typed rows for CSV readers (``csv2dict``, ``Csv2Dict``, ``DictReader`` from lessons 2 and 5)
+
+Column types inferred from sample of rows: bool, int, Decimal, float, date, datetime or str.
+Schema compiled into one converter function per row, so every field cast by direct call of type constructor
+(``int``, ``float``, ``Decimal``, ..) rather than by regular expressions.
+
+Empty strings and missing fields of non-str columns converted into None.
+Bad values handled by per-column error policy:
+    "raise": raise ValueError (default)
+    "null": replace value by None
+    "keep": keep original string
+    "skip": skip whole row
+
+    >>> with open("events.csv") as fp:
+    ...     for row in typed_rows(csv2dict(fp), errors={"payload": "keep"}):
+    ...         print(row)
+"""
+
+ERRORS = ("raise", "null", "keep", "skip")
+CAST_ERRORS = (ValueError, TypeError, ArithmeticError, KeyError)
+
+BOOLS = {"true": True, "false": False}
+INT_RE = re.compile(r"\s*[+-]?\d+\s*")
+FIXED_POINT_RE = re.compile(r"\s*[+-]?\d*\.(\d+)\s*")
+DATE_RE = re.compile(r"\d{4}-\d{2}-\d{2}")
+
+
+def cast_bool(value: str) -> bool:
+    """ Cast "true" / "false" in any case to bool """
+    return BOOLS[value.strip().lower()]
+
+
+def _is_float(value: str) -> bool:
+    try:
+        float(value)
+    except ValueError:
+        return False
+    return True
+
+
+def _is_datetime(value: str) -> bool:
+    try:
+        datetime.fromisoformat(value)
+    except ValueError:
+        return False
+    return True
+
+
+def infer_type(values):
+    """ Infer the narrowest type of not empty string ``values``
+
+    Fractional numbers with the same number of digits after point (e.g. money) inferred as Decimal,
+    other fractional numbers as float.
+
+    Returns:
+        bool, int, Decimal, float, date, datetime or str
+    """
+    values = [value for value in values if value]
+    if not values:
+        return str
+    if all(value.strip().lower() in BOOLS for value in values):
+        return bool
+    if all(INT_RE.fullmatch(value) for value in values):
+        return int
+    fixed = [FIXED_POINT_RE.fullmatch(value) or INT_RE.fullmatch(value) for value in values]
+    if all(fixed) and len({len(m.group(1)) for m in fixed if m.groups()}) == 1:
+        return Decimal
+    if all(_is_float(value) for value in values):
+        return float
+    if all(DATE_RE.fullmatch(value) for value in values):
+        return date
+    if all(_is_datetime(value) for value in values):
+        return datetime
+    return str
+
+
+CASTS = {
+    bool: cast_bool,
+    int: int,
+    float: float,
+    Decimal: Decimal,
+    date: date.fromisoformat,
+    datetime: datetime.fromisoformat,
+    str: str,
+}
+
+
+class SkipRow(Exception):
+    """ Row should be skipped by "skip" error policy """
+    pass
+
+
+class Schema:
+    """ Column types and error policies compiled into one row converter
+
+    Args:
+        types: dictionary of column name to type (bool, int, float, Decimal, date, datetime, str)
+        errors: error policy for all columns or dictionary of column name to policy. Default "raise"
+    """
+
+    def __init__(self, types: dict, errors="raise"):
+        if isinstance(errors, str):
+            errors = dict.fromkeys(types, errors)
+        for name, policy in errors.items():
+            if policy not in ERRORS:
+                raise ValueError(f"Unknown error policy {policy!r} for column {name!r}")
+        unknown = set(types.values()) - set(CASTS)
+        if unknown:
+            raise TypeError(f"Unsupported column types: {unknown}")
+        self.types = dict(types)
+        self.errors = {name: errors.get(name, "raise") for name in types}
+        self._fast = self._compile()
+
+    @classmethod
+    def infer(cls, rows, errors="raise"):
+        """ Infer schema from sample ``rows`` (list of dictionaries) """
+        names = list(dict.fromkeys(chain.from_iterable(rows)))
+        types = {name: infer_type([row.get(name) for row in rows]) for name in names}
+        return cls(types, errors)
+
+    def _compile(self):
+        """ Generate function which convert all fields of row without any checks """
+        namespace = {}
+        fields = []
+        for i, (name, type_) in enumerate(self.types.items()):
+            if type_ is str:
+                fields.append(f"{name!r}: row[{name!r}]")
+            else:
+                namespace[f"_cast{i}"] = CASTS[type_]
+                fields.append(f"{name!r}: _cast{i}(row[{name!r}])")
+        source = "def convert(row):\n    return {%s}\n" % ", ".join(fields)
+        exec(source, namespace)
+        return namespace["convert"]
+
+    def _convert_slow(self, row: dict) -> dict:
+        """ Convert fields of row one by one, empty values and errors handled by column policies """
+        result = {}
+        for name, type_ in self.types.items():
+            value = row.get(name)
+            if type_ is str or value is None:
+                result[name] = value
+                continue
+            if value == "":
+                result[name] = None
+                continue
+            try:
+                result[name] = CASTS[type_](value)
+            except CAST_ERRORS:
+                policy = self.errors[name]
+                if policy == "raise":
+                    raise ValueError(f"Cannot cast {value!r} of column {name!r} to {type_.__name__}")
+                if policy == "skip":
+                    raise SkipRow(name)
+                result[name] = None if policy == "null" else value
+        return result
+
+    def __call__(self, row: dict) -> dict:
+        """ Convert row. Raise ``SkipRow`` if row should be skipped """
+        try:
+            return self._fast(row)
+        except CAST_ERRORS:
+            return self._convert_slow(row)
+
+    def apply(self, rows):
+        """ Convert ``rows``. Rows skipped by error policy are not returned """
+        fast, slow = self._fast, self._convert_slow
+        for row in rows:
+            try:
+                yield fast(row)
+            except CAST_ERRORS:
+                try:
+                    yield slow(row)
+                except SkipRow:
+                    continue
+
+
+def typed_rows(rows, schema: Schema = None, sample_size: int = 1000, errors="raise"):
+    """ Convert dictionaries of strings returned by CSV reader into typed dictionaries
+
+    Args:
+        rows: iterator of dictionaries, e.g. ``csv2dict``, ``Csv2Dict`` or ``DictReader``
+        schema: Schema. Default None - infer from first ``sample_size`` rows
+        sample_size: number of rows to infer schema. Default 1000
+        errors: error policy for inferred schema, see ``Schema``. Default "raise"
+
+    Returns:
+        generator of dictionaries
+    """
+    rows = iter(rows)
+    if schema is None:
+        sample = list(islice(rows, sample_size))
+        schema = Schema.infer(sample, errors)
+        rows = chain(sample, rows)
+    return schema.apply(rows)
+
+
+if __name__ == "__main__":
+    import random
+    import timeit
+
+    from lesson_04.tasks.task_3 import BoolCastType, IntCastType, NumberCastType
+
+    random.seed(42)
+    rows = [
+        {"id": str(i), "active": random.choice(["true", "False"]), "amount": "%d.%02d" % (i, i % 100)}
+        for i in range(100000)
+    ]
+    schema = Schema.infer(rows[:1000])
+    print(schema.types)
+
+    casters = {"id": IntCastType(), "active": BoolCastType(), "amount": NumberCastType()}
+
+    def cast_per_field():
+        for row in rows:
+            {name: casters[name](value) for name, value in row.items()}
+
+    def cast_schema():
+        for _ in schema.apply(rows):
+            pass
+
+    for name, func in (("per field casters", cast_per_field), ("compiled schema", cast_schema)):
+        print("%-20s %.3f sec" % (name, min(timeit.repeat(func, number=1, repeat=3))))
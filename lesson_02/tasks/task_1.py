@@ -1,9 +1,85 @@
 import csv
+import io
+from collections import deque
+from decimal import Decimal
+from itertools import islice, zip_longest
+
+from lesson_01.utils import tail_offset
+from lesson_02.schema import Schema, SkipRow
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
 
 csv.field_size_limit(2 ** 31 - 1)  # Workaround to avoid _csv.Error: field larger than field limit (131072)
 
+# Column type of Schema -> numpy dtype of column, other types kept in arrays of objects.
+# numpy has no decimal type, so Decimal columns (e.g. money) converted to float
+NUMPY_DTYPES = {bool: "bool", int: "int64", float: "float64", Decimal: "float64"}
+SAMPLE_SIZE = 1000
+
+
+class _BoundedReader(io.RawIOBase):
+    """ Raw binary reader which stop reading of ``raw`` stream at byte offset ``end`` """
+
+    def __init__(self, raw, end):
+        self._raw = raw
+        self._end = end
+
+    def readable(self):
+        return True
+
+    def readinto(self, b):
+        data = self._raw.read(max(min(len(b), self._end - self._raw.tell()), 0))
+        b[:len(data)] = data
+        return len(data)
+
+
+def _open_until_footer(file, footer):
+    """ Open text file ``file`` from current position till beginning of last ``footer`` lines
+
+    Beginning of footer found by reading underlying binary file backward from the end. Lines returned
+    untranslated as with ``newline=""``, which ``csv`` requires to keep line ends inside quoted fields.
+
+    Returns:
+        text file-like object or None if ``file`` is not seekable text file with ASCII compatible encoding
+    """
+    try:
+        # io.StringIO and other in-memory text streams have no encoding and no underlying buffer
+        if file.encoding is None or not file.seekable() or "\n".encode(file.encoding) != b"\n":
+            return None
+        raw = file.buffer
+        pos = file.tell()
+        end = tail_offset(raw, footer)
+    except (AttributeError, OSError, LookupError):
+        return None
+    if pos > raw.seek(0, io.SEEK_END):
+        # Position contains decoder state, it cannot be used as byte offset
+        return None
+    raw.seek(min(pos, end))
+    return io.TextIOWrapper(io.BufferedReader(_BoundedReader(raw, end)), encoding=file.encoding, errors=file.errors,
+                            newline="")
+
 
 def skip_line(file, start=0, footer=0):
+    """ Skip first ``start`` and last ``footer`` lines of ``file``
+
+    Last lines of seekable text file found by reading file backward from the end,
+    other streams read through lookahead buffer of ``footer`` lines. Memory use is O(footer).
+
+    Args:
+        file: file-like object / stream / Iterator
+        start: number of first lines to skip. Default 0
+        footer: number of last lines to skip. Default 0
+
+    Returns:
+        Generator
+    """
+    if footer > 0:
+        bounded = _open_until_footer(file, footer)
+        if bounded is not None:
+            file, footer = bounded, 0
     try:
         for _ in range(start):
             next(file)
@@ -11,19 +87,11 @@ def skip_line(file, start=0, footer=0):
         return
     if footer == 0:
         yield from file
-    else:
-        list_file = list(file)
-        len_file = len(list_file)
-        iter_file = iter(list_file)
-        if len_file > footer:
-            len_file -= footer
-            try:
-                for _ in range(len_file):
-                    yield next(iter_file)
-            except StopIteration:
-                return
-        else:
-            return
+        return
+    window = deque(islice(file, footer))
+    for line in file:
+        window.append(line)
+        yield window.popleft()
 
 
 def csv2dict(fp, start_position=0, header=True, fieldnames=None, delimiter=",", quotechar='"', footer=0):
@@ -81,6 +149,111 @@ def csv2dict(fp, start_position=0, header=True, fieldnames=None, delimiter=",",
         yield dict(zip(fieldnames, item))
 
 
+def csv2columns(fp, batch_size=10000, start_position=0, header=True, fieldnames=None, delimiter=",", quotechar='"',
+                footer=0, as_numpy=False, schema: Schema = None):
+    """ CSV to column-oriented batches Generator
+
+    Args:
+        fp: file-like object / stream / Iterator
+        batch_size: number of rows in one batch. Default: 10000
+        start_position: start line if file-like object / stream. Default: 0
+        header: Is header exists into file-like object / stream. Default: True
+        fieldnames: list or tuple of field name. Default: None
+        delimiter: A one-character string used to separate fields. It defaults to ','.
+        quotechar: A one-character string used to quote fields, see ``csv2dict``. It defaults to '"'
+        footer: Positive-integer. Skip last lines in a file-like object / stream. Default: 0
+        as_numpy: return columns as numpy arrays rather than lists. Default: False
+        schema: Schema to cast values of columns, see ``lesson_02.schema``. Default: None - values are strings,
+            with ``as_numpy`` schema inferred from first rows
+
+    Requirements are the same as for ``csv2dict``, but rather than dictionary per row generator return
+    dictionary of column name to list (or numpy array) of ``batch_size`` values:
+        { "header_element_1": ["csv_element_1_1", "csv_element_2_1", ..],
+          "header_element_2": ["csv_element_1_2", "csv_element_2_2", ..], ..
+        }
+    Missing fields of short rows are None, extra fields of long rows are ignored.
+    Numpy arrays of bool, int and float (or Decimal) columns have dtype bool, int64 and float64 (nulls are NaN),
+    other columns and columns with null values which dtype cannot hold are arrays of objects.
+
+    The same dictionary and the same lists (numpy buffers) are reused for every batch,
+    so copy them if batch should be kept after the next one is requested.
+    """
+    if as_numpy and numpy is None:
+        raise RuntimeError("Install 'numpy' package to return columns as numpy arrays")
+    lines_gen = skip_line(fp, start_position, footer)
+    lines = csv.reader(lines_gen, delimiter=delimiter, quotechar=quotechar)
+
+    first = []
+    if header is True:
+        try:
+            fieldnames = next(lines)
+        except StopIteration:
+            return
+    elif fieldnames is None:
+        try:
+            first = [next(lines)]
+        except StopIteration:
+            return
+        fieldnames = ["col%02d" % i for i in range(len(first[0]))]
+
+    if as_numpy and schema is None:
+        first += list(islice(lines, SAMPLE_SIZE - len(first)))
+        schema = Schema.infer([dict(zip(fieldnames, row)) for row in first])
+
+    if as_numpy:
+        types = schema.types
+        buffers = [numpy.empty(batch_size, dtype=NUMPY_DTYPES.get(types.get(name), object)) for name in fieldnames]
+    else:
+        buffers = [[] for _ in fieldnames]
+    columns = dict(zip(fieldnames, buffers))
+    width = len(fieldnames)
+
+    while True:
+        rows = first + list(islice(lines, max(batch_size - len(first), 0)))
+        first = rows[batch_size:]
+        del rows[batch_size:]
+        if not rows:
+            return
+        if schema is not None:
+            values = _typed_columns(rows, fieldnames, schema)
+            size = len(values[0]) if values else 0
+        else:
+            values = list(zip_longest(*rows))[:width]
+            values += [(None,) * len(rows)] * (width - len(values))
+            size = len(rows)
+        for name, buffer, column in zip(fieldnames, buffers, values):
+            if as_numpy:
+                columns[name] = _to_array(buffer, column, size)
+            else:
+                buffer[:] = column
+        yield columns
+
+
+def _to_array(buffer, column, size: int):
+    """ Copy ``column`` into numpy ``buffer``, array of objects if values don't fit dtype of buffer """
+    # None would be cast to False for bool and fail for int columns, float columns store it as NaN
+    if buffer.dtype == object or buffer.dtype.kind == "f" or None not in column:
+        try:
+            buffer[:size] = column
+            return buffer[:size]
+        except (TypeError, ValueError, OverflowError):
+            pass
+    return numpy.array(column, dtype=object)
+
+
+def _typed_columns(rows, fieldnames, schema: Schema) -> list:
+    """ Cast ``rows`` by ``schema`` and transpose them into list of columns, rows skipped by schema dropped """
+    records = []
+    for row in rows:
+        record = dict(zip(fieldnames, row))
+        try:
+            record.update(schema(record))
+        except SkipRow:
+            continue
+        records.append(record)
+    return [[record.get(name) for record in records] for name in fieldnames]
+
+
 if __name__ == "__main__":
     f = "events.csv"
 
@@ -40,11 +40,78 @@ from datetime import date as _d
 
 """
 
+import gzip
 import json
+import uuid
+
+BATCH_SIZE = 1000  # number of items of list / dict encoded by one call of C encoder
+WRITE_CHUNK_SIZE = 1024 * 1024  # minimal size of one ``fp.write`` call in characters
+
+_CONTAINERS = (list, tuple, dict)
+
+
+def _datetime_to_str(o):
+    return o.isoformat(" ", "microseconds") if o.tzinfo is None else o.strftime("%Y-%m-%d %H:%M:%S.%f")
+
+
+def _time_to_str(o):
+    return o.isoformat("microseconds") if o.tzinfo is None else o.strftime("%H:%M:%S.%f")
 
 
 class JSONEncoderExtended(json.JSONEncoder):
+    """ JSON encoder of extended types, see convert rules above
+
+    Args:
+        use_decimal: encode Decimal as raw JSON number with all its digits instead of float. Default False
+        kw: key-words arguments same as ``json.JSONEncoder`` has
+    """
+
+    # Exact type of object -> function which convert it into JSON serializable object
+    casts = {
+        _dt: _datetime_to_str,
+        _d: _d.isoformat,
+        _t: _time_to_str,
+        _D: float,
+        set: list,
+        frozenset: list,
+    }
+
+    def __init__(self, *, use_decimal=False, **kw):
+        super(JSONEncoderExtended, self).__init__(**kw)
+        self.use_decimal = use_decimal
+        if use_decimal:
+            # C encoder has no hook for raw numbers, so Decimal encoded as string wrapped by unique token
+            # and quotes with tokens removed from encoded chunks: '"<token>1.10<token>"' -> '1.10'
+            self._token = token = uuid.uuid4().hex
+            self._raw_prefix = '"' + token
+            self._raw_suffix = token + '"'
+            self.casts = dict(self.casts)
+            self.casts[_D] = self._decimal_to_raw
+        else:
+            self._raw_prefix = None
+
+    def _decimal_to_raw(self, o):
+        if not o.is_finite():
+            # NaN and Infinity handled by ``allow_nan`` the same manner as floats
+            return float("nan") if o.is_nan() else float(o)
+        return self._token + str(o) + self._token
+
+    def _unwrap_raw(self, chunk):
+        if self._raw_prefix in chunk:
+            return chunk.replace(self._raw_prefix, "").replace(self._raw_suffix, "")
+        return chunk
+
+    def iterencode(self, o, _one_shot=False):
+        chunks = super(JSONEncoderExtended, self).iterencode(o, _one_shot)
+        if self._raw_prefix is None:
+            return chunks
+        return map(self._unwrap_raw, chunks)
+
     def default(self, o):
+        cast = self.casts.get(type(o))
+        if cast is not None:
+            return cast(o)
+        # Subclasses of supported types
         if isinstance(o, _dt):
             return o.strftime("%Y-%m-%d %H:%M:%S.%f")
         if isinstance(o, _d):
@@ -52,18 +119,257 @@ class JSONEncoderExtended(json.JSONEncoder):
         if isinstance(o, _t):
             return o.strftime("%H:%M:%S.%f")
         if isinstance(o, _D):
-            return float(o)
-        if isinstance(o,  set):
+            return self.casts[_D](o)
+        if isinstance(o,  (set, frozenset)):
             return list(o)
         return super(JSONEncoderExtended, self).default(o)
 
+    def iterencode_batched(self, o, batch_size=BATCH_SIZE, _markers=None):
+        """ Encode object ``o`` by chunks
+
+        Large lists and dictionaries encoded by batches of ``batch_size`` items with C encoder,
+        which is much faster than pure Python ``iterencode`` used by ``json.dump``.
+        Pure Python ``iterencode`` is used only if ``indent`` is set.
+
+        Args:
+            o: object for convert
+            batch_size: number of items of list / dict encoded at once. Default 1000
+
+        Returns:
+            generator of strings
+        """
+        if self.indent is not None:
+            yield from self.iterencode(o)
+            return
+        t = type(o)
+        if t not in _CONTAINERS or len(o) <= batch_size:
+            yield self.encode(o)
+            return
+        if self.check_circular:
+            _markers = _markers or set()
+            if id(o) in _markers:
+                raise ValueError("Circular reference detected")
+            _markers.add(id(o))
+
+        if t is dict:
+            items = sorted(o.items()) if self.sort_keys else o.items()
+            pack = dict
+            yield "{"
+        else:
+            items = o
+            pack = list
+            yield "["
+        separator = ""
+        batch = []
+        for item in items:
+            value = item[1] if t is dict else item
+            if type(value) not in _CONTAINERS or len(value) <= batch_size:
+                batch.append(item)
+                if len(batch) < batch_size:
+                    continue
+                value = None
+            if batch:
+                chunk = self.encode(pack(batch))[1:-1]
+                batch = []
+                if chunk:
+                    yield separator + chunk
+                    separator = self.item_separator
+            if value is None:
+                continue
+            # Large nested container encoded by batches too
+            if t is dict:
+                # Encode key by the same rules as C encoder: '{"key": 0}' -> '"key": '
+                key = self.encode({item[0]: 0})[1:-2]
+                if not key:
+                    continue
+                yield separator + key
+            else:
+                yield separator
+            separator = self.item_separator
+            yield from self.iterencode_batched(value, batch_size, _markers)
+        if batch:
+            chunk = self.encode(pack(batch))[1:-1]
+            if chunk:
+                yield separator + chunk
+        yield "}" if t is dict else "]"
+        if _markers is not None:
+            _markers.discard(id(o))
+
+
+_default_encoder = JSONEncoderExtended()
+_decimal_encoder = JSONEncoderExtended(use_decimal=True)
+_decimal_decoder = json.JSONDecoder(parse_float=_D, parse_constant=_D)
+
+
+def _get_encoder(kw):
+    """ Shared encoder for default options, new one otherwise """
+    if not kw:
+        return _default_encoder
+    if kw == {"use_decimal": True}:
+        return _decimal_encoder
+    return JSONEncoderExtended(**kw)
+
 
 def json_dumps(obj, **kw):
-    return json.dumps(obj, cls=JSONEncoderExtended, **kw)
+    return _get_encoder(kw).encode(obj)
+
+
+def json_loads(s, use_decimal=False, **kw):
+    """ Convert JSON string into Python objects
+
+    Args:
+        s: JSON string
+        use_decimal: parse fractional numbers, NaN and Infinity as Decimal. Default False
+        kw: key-words arguments same as ``json.loads()`` has
+
+    Returns:
+        Python object
+    """
+    if use_decimal:
+        if not kw:
+            return _decimal_decoder.decode(s)
+        kw.setdefault("parse_float", _D)
+        kw.setdefault("parse_constant", _D)
+    return json.loads(s, **kw)
+
+
+def json_dump(obj, fp, chunk_size=WRITE_CHUNK_SIZE, **kw):
+    """ Convert Python objects into JSON and write it into file-like object ``fp`` by large chunks
+
+    Args:
+        obj: object for convert
+        fp: file-like object
+        chunk_size: minimal size of one ``fp.write`` call in characters. Default 1 MiB
+        kw: key-words arguments same as ``json.dump()`` has
+    """
+    encoder = _get_encoder(kw)
+    buffer, size = [], 0
+    for chunk in encoder.iterencode_batched(obj):
+        buffer.append(chunk)
+        size += len(chunk)
+        if size >= chunk_size:
+            fp.write("".join(buffer))
+            buffer, size = [], 0
+    if buffer:
+        fp.write("".join(buffer))
+
+
+class NDJSONWriter:
+    """ Newline-delimited JSON writer: one JSON document per line
+
+    Records encoded by one ``JSONEncoderExtended`` instance and written by one ``fp.write`` call
+    per ``batch_size`` records.
+
+    Args:
+        fp: path to file or file-like object. Text file-like object if ``compress`` is False, otherwise binary
+        batch_size: number of records in one write. Default 1000
+        compress: write gzip compressed output. Default False
+        compresslevel: gzip compression level. Default 6
+        kw: key-words arguments of ``JSONEncoderExtended`` (``indent`` is not allowed)
+
+    Example:
+        with NDJSONWriter("events.ndjson.gz", compress=True) as writer:
+            writer.write_many(csv2dict(fp))
+    """
+
+    def __init__(self, fp, batch_size=BATCH_SIZE, compress=False, compresslevel=6, **kw):
+        if kw.get("indent") is not None:
+            raise ValueError("NDJSON document should be written in one line, 'indent' is not allowed")
+        self._own = isinstance(fp, str)
+        if compress:
+            self.fp = gzip.open(fp, "wt", compresslevel=compresslevel, encoding="utf-8")
+            self._own = True
+        else:
+            self.fp = open(fp, "w", encoding="utf-8") if self._own else fp
+        self.batch_size = batch_size
+        self.encode = _get_encoder(kw).encode
+        self.buffer = []
+        self.count = 0
+        self.closed = False
+
+    def write(self, record):
+        """ Add record into buffer and write buffer if it is full """
+        self.buffer.append(self.encode(record))
+        if len(self.buffer) >= self.batch_size:
+            self.flush()
+
+    def write_many(self, records) -> int:
+        """ Write all ``records`` of iterator
+
+        Returns:
+            number of written records
+        """
+        encode, batch_size, count = self.encode, self.batch_size, 0
+        records = iter(records)
+        while True:
+            batch = [encode(record) for _, record in zip(range(batch_size), records)]
+            if not batch:
+                break
+            self.buffer.extend(batch)
+            self.flush()
+            count += len(batch)
+        return count
+
+    def flush(self):
+        """ Write buffered records into file """
+        if self.buffer:
+            self.buffer.append("")
+            self.fp.write("\n".join(self.buffer))
+            self.count += len(self.buffer) - 1
+            self.buffer = []
+
+    def close(self):
+        """ Write buffered records and close file opened by writer """
+        if self.closed:
+            return
+        self.flush()
+        self.closed = True
+        if self._own:
+            self.fp.close()
+        else:
+            self.fp.flush()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+
+def ndjson_dump(records, fp, batch_size=BATCH_SIZE, compress=False, **kw) -> int:
+    """ Write iterator of ``records`` (e.g. CSV reader from lesson 2 / lesson 5) into NDJSON file
+
+    Args:
+        records: iterator of JSON serializable objects
+        fp: path to file or file-like object, see ``NDJSONWriter``
+        batch_size: number of records in one write. Default 1000
+        compress: write gzip compressed output. Default False
+        kw: key-words arguments of ``JSONEncoderExtended``
+
+    Returns:
+        number of written records
+    """
+    with NDJSONWriter(fp, batch_size, compress, **kw) as writer:
+        return writer.write_many(records)
+
+
+def csv2ndjson(csv_path, ndjson_path, compress=False, batch_size=BATCH_SIZE, **csv_kw) -> int:
+    """ Convert CSV file into NDJSON file in one pass
+
+    Args:
+        csv_path: path to CSV file
+        ndjson_path: path to output file
+        compress: write gzip compressed output. Default False
+        batch_size: number of records in one write. Default 1000
+        csv_kw: key-words arguments of ``csv2dict`` (start_position, header, fieldnames, ..)
 
+    Returns:
+        number of written records
+    """
+    from lesson_02.tasks.task_1 import csv2dict
 
-def json_dump(obj, fp, **kw):
-    return json.dump(obj, fp, cls=JSONEncoderExtended, **kw)
+    with open(csv_path, "r", newline="") as fp:
+        return ndjson_dump(csv2dict(fp, **csv_kw), ndjson_path, batch_size, compress)
 
 
 if __name__ == "__main__":
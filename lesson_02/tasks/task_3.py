@@ -1,4 +1,12 @@
 import csv
+import io
+import os
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from itertools import repeat
+
+from lesson_01.utils import BLOCK_SIZE, iter_blocks, iter_head, tail_offset
+from lesson_02.tasks.task_1 import skip_line
 
 csv.field_size_limit(2 ** 31 - 1)  # Workaround to avoid _csv.Error: field larger than field limit (131072)
 
@@ -69,27 +77,167 @@ class Csv2Dict:
         return dict(zip(self.fieldnames, item))
 
 
-def skip_line(file, start=0, footer=0):
-    try:
-        for _ in range(start):
-            next(file)
-    except StopIteration:
-        return
-    if footer == 0:
-        yield from file
-    else:
-        list_file = list(file)
-        len_file = len(list_file)
-        iter_file = iter(list_file)
-        if len_file > footer:
-            len_file -= footer
-            try:
-                for _ in range(len_file):
-                    yield next(iter_file)
-            except StopIteration:
-                return
-        else:
-            return
+def find_record_end(f, start: int, end: int, quotechar: bytes, quoted: bool = False) -> int:
+    """ Find end of CSV record in binary file ``f`` which contain byte offset ``start``
+
+    Newline is end of record if it is not inside of quoted field: number of ``quotechar`` before it is even.
+    Escaped quotes are doubled (``doublequote=True``), so they don't change parity.
+
+    Args:
+        f: seekable binary file-like object
+        start: byte offset to start looking from
+        end: byte offset to stop looking at
+        quotechar: quote character. Bytes
+        quoted: ``start`` is inside of quoted field. Default False
+
+    Returns:
+        byte offset after newline which end the record or ``end`` if record is not ended before ``end``
+    """
+    pos = start
+    for block in iter_blocks(f, start, end, BLOCK_SIZE):
+        i = 0
+        idx = block.find(b"\n")
+        while idx != -1:
+            quoted ^= block.count(quotechar, i, idx) % 2 == 1
+            if not quoted:
+                return pos + idx + 1
+            i = idx
+            idx = block.find(b"\n", idx + 1)
+        quoted ^= block.count(quotechar, i) % 2 == 1
+        pos += len(block)
+    return end
+
+
+def count_quotes(filepath: str, start: int, end: int, quotechar: bytes) -> int:
+    """ Count ``quotechar`` in byte range [``start``; ``end``) of file ``filepath`` """
+    with open(filepath, "rb") as f:
+        return sum(block.count(quotechar) for block in iter_blocks(f, start, end, 1024 * 1024))
+
+
+def parse_range(filepath: str, start: int, end: int, delimiter: str, quotechar: str, encoding: str) -> list:
+    """ Parse byte range [``start``; ``end``) of CSV file ``filepath`` aligned to records boundaries
+
+    Returns:
+        list of rows. Rows are tuples of values, which are cheaper to send between processes than dictionaries
+    """
+    with open(filepath, "rb") as f:
+        f.seek(start)
+        text = f.read(end - start).decode(encoding)
+    rows = csv.reader(io.StringIO(text, newline=""), delimiter=delimiter, quotechar=quotechar)
+    return list(map(tuple, rows))
+
+
+class ParallelCsv2Dict:
+    """ CSV to Dict Iterator which parse local file by pool of processes
+
+    Args:
+        filepath: path to CSV file
+        start_position: start line of file. Default: 0
+        header: Is header exists into file. Default: True
+        fieldnames: list or tuple of field name. Default: None
+        delimiter: A one-character string used to separate fields. It defaults to ','.
+        quotechar: A one-character string used to quote fields. It defaults to '"'
+        footer: Positive-integer. Skip last lines in a file. Default: 0
+        workers: number of processes. Default: None - number of processors
+        ordered: return rows in file order, otherwise in order of parsed chunks completion. Default: True
+        chunk_size: approximate size of chunk parsed by one process in bytes. Default: 16 MiB
+        encoding: encoding of file. Default: 'utf-8'
+
+    ``start_position``, ``header``, ``fieldnames`` and ``footer`` have the same meaning as in ``Csv2Dict``.
+    File split into byte ranges aligned to records boundaries by parity of quote characters,
+    so quoted fields may contain newlines. Quote characters should be escaped by doubling.
+    Unlike ``Csv2Dict``, ``start_position`` can't split quoted field: parity of quotes before it should be even.
+
+    Raises:
+        ValueError: If line ``start_position`` starts inside of quoted field
+    """
+
+    def __init__(self, filepath, start_position=0, header=True, fieldnames=None, delimiter=",", quotechar='"',
+                 footer=0, workers=None, ordered=True, chunk_size=16 * 1024 * 1024, encoding="utf-8"):
+        self.filepath = filepath
+        self.fieldnames = fieldnames
+        self.delimiter = delimiter
+        self.quotechar = quotechar
+        self.workers = workers or os.cpu_count()
+        self.ordered = ordered
+        self.chunk_size = chunk_size
+        self.encoding = encoding
+        self.first_row = None
+        self.ranges = []
+        self.rows = iter([])
+
+        with open(filepath, "rb") as f:
+            start = sum(len(block) for block in iter_head(f, start_position))
+            if count_quotes(filepath, 0, start, quotechar.encode()) % 2 == 1:
+                # Csv2Dict parse the rest of quoted field as unquoted, which can't be split by parity of quotes
+                raise ValueError(f"Line {start_position} starts inside of quoted field, use Csv2Dict to start from it")
+            end = max(tail_offset(f, footer), start)
+            if header is True or fieldnames is None:
+                record_end = find_record_end(f, start, end, quotechar.encode())
+                f.seek(start)
+                record = f.read(record_end - start).decode(encoding)
+                row = next(csv.reader(io.StringIO(record, newline=""), delimiter=delimiter, quotechar=quotechar),
+                           None)
+                if row is None:
+                    return
+                if header is True:
+                    self.fieldnames = row
+                else:
+                    self.fieldnames = ["col%02d" % i for i in range(len(row))]
+                    self.first_row = dict(zip(self.fieldnames, row))
+                start = record_end
+            self.ranges = self.split(f, start, end)
+        self.rows = self.generate()
+
+    def split(self, f, start: int, end: int) -> list:
+        """ Split byte range [``start``; ``end``) of file ``f`` into ranges aligned to records boundaries """
+        bounds = list(range(start, end, self.chunk_size)) + [end]
+        quote = self.quotechar.encode()
+        if len(bounds) <= 2:
+            return [(start, end)] if start < end else []
+        with ProcessPoolExecutor(self.workers) as pool:
+            counts = list(pool.map(count_quotes, [self.filepath] * (len(bounds) - 1), bounds[:-1], bounds[1:],
+                                   [quote] * (len(bounds) - 1)))
+        aligned = [start]
+        quotes = 0
+        for bound, count in zip(bounds[1:-1], counts):
+            quotes += count
+            if bound > aligned[-1]:
+                aligned.append(find_record_end(f, bound, end, quote, quotes % 2 == 1))
+        if aligned[-1] < end:
+            aligned.append(end)
+        return [(a, b) for a, b in zip(aligned, aligned[1:]) if a < b]
+
+    def generate(self):
+        """ Parse ranges by pool of processes and return rows """
+        args = (self.delimiter, self.quotechar, self.encoding)
+        ranges = iter(self.ranges)
+        with ProcessPoolExecutor(self.workers) as pool:
+            pending = deque()
+            for start, end in ranges:
+                pending.append(pool.submit(parse_range, self.filepath, start, end, *args))
+                if len(pending) >= 2 * self.workers:
+                    break
+            while pending:
+                if self.ordered:
+                    done = pending.popleft()
+                else:
+                    completed, _ = wait(pending, return_when=FIRST_COMPLETED)
+                    done = completed.pop()
+                    pending.remove(done)
+                for start, end in ranges:
+                    pending.append(pool.submit(parse_range, self.filepath, start, end, *args))
+                    break
+                yield from map(dict, map(zip, repeat(self.fieldnames), done.result()))
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        if self.first_row is not None:
+            row, self.first_row = self.first_row, None
+            return row
+        return next(self.rows)
 
 
 if __name__ == "__main__":
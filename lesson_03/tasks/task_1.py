@@ -19,7 +19,16 @@ Requirement:
     5. Use Type Hinting + Docstring
 """
 
+import multiprocessing
+import os
+import threading
+import weakref
 from collections.abc import Iterator
+from itertools import count, islice
+from operator import length_hint
+from types import SimpleNamespace
+
+CACHE = 1000  # number of values reserved by one lock acquisition of Sequence
 
 
 class Count(Iterator):
@@ -36,6 +45,7 @@ class Count(Iterator):
         self._name = name
         self._start = start
         self._step = step
+        self._lock = threading.Lock()
 
     @property
     def name(self) -> str:
@@ -68,9 +78,135 @@ class Count(Iterator):
         return self.__next__()
 
     def __next__(self):
-        self.buff = self._start
-        self._start += self._step
-        return self.buff
+        with self._lock:
+            value = self._start
+            self._start += self._step
+        return value
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        del state["_lock"]
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+
+
+# Shared sequences which should drop blocks reserved by parent process after fork
+_shared_sequences = weakref.WeakSet()
+
+
+def _reset_shared_sequences():
+    for sequence in list(_shared_sequences):
+        sequence._local = threading.local()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_shared_sequences)
+
+
+class Sequence(Count):
+    """ Sequence which reserve blocks of values, like database sequence with CACHE
+
+    Every thread (and process in shared mode) reserve ``cache`` values under lock and then
+    return them without any locking. Values are unique and increase within thread,
+    but values of different threads interleave.
+    """
+
+    def __init__(self, name: str = None, start: int = 0, step: int = 1, cache: int = CACHE, shared: bool = False):
+        """ Initialize object of Sequence
+
+        Args:
+            name: Name of sequence. Optional. Default to None. String
+            start: first value. Optional. Default to 0. Integer or float
+            step: Optional. Default to 1.
+            cache: number of values reserved at once. Optional. Default to 1000
+            shared: keep sequence in shared memory, so ``multiprocessing`` workers draw values from one sequence.
+                Sequence should be passed to workers as argument of ``Process`` or ``Pool`` initializer.
+                Optional. Default to False
+        """
+        if cache < 1:
+            raise ValueError("cache should be great or equal 1")
+        super(Sequence, self).__init__(name, start, step)
+        self._cache = cache
+        self._shared = shared
+        if shared:
+            typecode = "q" if isinstance(start, int) and isinstance(step, int) else "d"
+            self._store = multiprocessing.Value(typecode, start)
+            self._lock = self._store.get_lock()
+            _shared_sequences.add(self)
+        else:
+            self._store = SimpleNamespace(value=start)
+        self._local = threading.local()
+
+    @property
+    def curval(self):
+        """
+
+        Returns:
+            value which next call of ``nextval`` return in current thread, as ``Count.curval`` does.
+            If reserved values of thread are over, it is the first not reserved value, which other
+            thread may take before
+
+        """
+        local = self._local
+        if length_hint(getattr(local, "block", ())):
+            return local.value + self._step
+        return self._store.value
+
+    @property
+    def lastval(self):
+        """
+
+        Returns:
+            last value returned in current thread or None
+
+        """
+        return getattr(self._local, "value", None)
+
+    @property
+    def cache(self) -> int:
+        """
+
+        Returns:
+            int: number of values reserved at once
+
+        """
+        return self._cache
+
+    def _reserve(self):
+        """ Reserve next block of values """
+        with self._lock:
+            first = self._store.value
+            self._store.value = first + self._step * self._cache
+        # Iterators of range and list know number of values left for ``curval``
+        if isinstance(first, int) and isinstance(self._step, int) and self._step:
+            return iter(range(first, first + self._step * self._cache, self._step))
+        return iter(list(islice(count(first, self._step), self._cache)))
+
+    def __next__(self):
+        local = self._local
+        try:
+            local.value = next(local.block)
+        except (AttributeError, StopIteration):
+            local.block = self._reserve()
+            local.value = next(local.block)
+        return local.value
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        del state["_lock"], state["_local"]
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._local = threading.local()
+        if self._shared:
+            self._lock = self._store.get_lock()
+            _shared_sequences.add(self)
+        else:
+            self._lock = threading.Lock()
 
 
 if __name__ == "__main__":
@@ -87,4 +223,11 @@ if __name__ == "__main__":
     print("Counter: %r" % counter2.name)
 
     for _ in range(10):
-        print(next(counter2))
\ No newline at end of file
+        print(next(counter2))
+
+    from concurrent.futures import ThreadPoolExecutor
+
+    sequence = Sequence(name="ids", cache=100)
+    with ThreadPoolExecutor(4) as pool:
+        ids = sum(pool.map(lambda _: [next(sequence) for _ in range(1000)], range(8)), [])
+    print("Sequence %r: %d ids, %d unique" % (sequence.name, len(ids), len(set(ids))))
@@ -1,5 +1,9 @@
+import atexit
 import inspect
 import functools
+import random
+import time
+from collections import defaultdict
 """ Task 2: Create function decorator
 
 Requirement:
@@ -60,16 +64,137 @@ def simple_logger(func):
     return wrapper
 
 
-if __name__ == "__main__":
-    import time
+class CallStats:
+    """ Aggregated execution times of function in nanoseconds
+
+    Times stored in log-linear histogram with 16 buckets per power of two,
+    so p50 / p99 are approximate (error less than 1/16) and memory does not grow with number of calls.
+    """
+
+    __slots__ = ("name", "count", "total", "min", "max", "buckets")
+
+    def __init__(self, name: str):
+        self.name = name
+        self.reset()
+
+    def reset(self):
+        """ Drop collected times """
+        self.count = 0
+        self.total = 0
+        self.min = float("inf")
+        self.max = 0
+        self.buckets = defaultdict(int)
+
+    def add(self, elapsed: int):
+        """ Add execution time ``elapsed`` in nanoseconds """
+        self.count += 1
+        self.total += elapsed
+        if elapsed < self.min:
+            self.min = elapsed
+        if elapsed > self.max:
+            self.max = elapsed
+        shift = elapsed.bit_length() - 5
+        self.buckets[elapsed >> shift << shift if shift > 0 else elapsed] += 1
+
+    def percentile(self, q: float) -> int:
+        """ Approximate ``q`` percentile (0 - 100) of execution time in nanoseconds """
+        if not self.count:
+            return None
+        rank = q / 100 * self.count
+        seen = 0
+        for key in sorted(self.buckets):
+            seen += self.buckets[key]
+            if seen >= rank:
+                # middle of bucket
+                shift = key.bit_length() - 5
+                middle = key + (1 << shift >> 1) if shift > 0 else key
+                return max(min(middle, self.max), self.min)
+        return self.max
+
+    def report(self) -> str:
+        """ One line report: count, min, max, p50, p99 in microseconds """
+        if not self.count:
+            return f"{self.name}: no calls"
+        return "%s: count=%d min=%.3f max=%.3f p50=%.3f p99=%.3f us" % (
+            self.name, self.count, self.min / 1e3, self.max / 1e3,
+            self.percentile(50) / 1e3, self.percentile(99) / 1e3,
+        )
+
+
+def sampling_logger(func=None, *, sample_rate: float = 0.01, threshold: float = None,
+                    flush_interval: float = None, at_exit: bool = True, output=print):
+    """ Low overhead profiling decorator for hot functions
+
+    Signature of function inspected once at decoration time. Every call timed by ``time.perf_counter_ns``
+    and aggregated into ``CallStats`` (``wrapper.stats``), but only sampled calls and calls slower
+    than ``threshold`` are logged with their arguments. Statistics are not locked, so counts of function
+    called from many threads are approximate.
+
+    Args:
+        func: function to decorate. Decorator could be used with and without arguments
+        sample_rate: fraction of calls to log (0 - 1). Default 0.01
+        threshold: log every call which take longer than ``threshold`` seconds. Default None - no threshold
+        flush_interval: output statistics and reset it every ``flush_interval`` seconds.
+            Checked on calls of function. Default None - no periodic flush
+        at_exit: output statistics on interpreter exit. Default True
+        output: function which output log line. Default print
+
+    Returns:
+        decorated function with ``stats`` attribute and ``flush()`` method
+    """
+    if func is None:
+        return functools.partial(sampling_logger, sample_rate=sample_rate, threshold=threshold,
+                                 flush_interval=flush_interval, at_exit=at_exit, output=output)
+
+    signature = inspect.signature(func)
+    stats = CallStats(func.__qualname__)
+    threshold_ns = None if threshold is None else int(threshold * 1e9)
+    interval_ns = None if flush_interval is None else int(flush_interval * 1e9)
+    next_flush = None if interval_ns is None else time.perf_counter_ns() + interval_ns
+    perf_counter_ns = time.perf_counter_ns
+
+    def log_call(args, kwargs, elapsed, result):
+        try:
+            bound = signature.bind(*args, **kwargs)
+            bound.apply_defaults()
+            arguments = ", ".join("%s=%r" % item for item in bound.arguments.items())
+        except TypeError:
+            arguments = "*%r, **%r" % (args, kwargs)
+        output("%s(%s) -> %r\t%.3f sec" % (stats.name, arguments, result, elapsed / 1e9))
+
+    def flush():
+        output(stats.report())
+        stats.reset()
 
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        nonlocal next_flush
+        start = perf_counter_ns()
+        result = func(*args, **kwargs)
+        end = perf_counter_ns()
+        elapsed = end - start
+        stats.add(elapsed)
+        if (threshold_ns is not None and elapsed >= threshold_ns) or (sample_rate and random.random() < sample_rate):
+            log_call(args, kwargs, elapsed, result)
+        if next_flush is not None and end >= next_flush:
+            next_flush = end + interval_ns
+            flush()
+        return result
+
+    wrapper.stats = stats
+    wrapper.flush = flush
+    if at_exit:
+        atexit.register(lambda: stats.count and flush())
+    return wrapper
+
+
+if __name__ == "__main__":
     @simple_logger
     def simple_function(a):
         """Print some value"""
         print(a)
         print("I'm return nothing!")
 
-
     @simple_logger
     def not_simple_function(sleep_time=3, result=42):
         """Sleep and return value"""
@@ -85,3 +210,12 @@ if __name__ == "__main__":
     not_simple_function()
 
     not_simple_function(sleep_time=.1, result=100 ** 100)
+
+    @sampling_logger(sample_rate=0.0001, threshold=0.001)
+    def hot_function(a, b=2):
+        """Sum values"""
+        return a + b
+
+    for i in range(100000):
+        hot_function(i)
+    hot_function.flush()
@@ -1,7 +1,13 @@
 import re
+from collections import namedtuple
 from decimal import Decimal as decimal
 import functools
 
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
 """ Task 3: Create functions which convert from ``str`` to another Python Type
 
 Requirement:
@@ -28,6 +34,27 @@ Requirement:
 """
 
 
+BOOLS = {"true": True, "false": False}
+
+# Plain literals, which type constructor convert to the same value as search of fallback pattern does.
+# Constructors accept more (underscores, "nan", "inf", exponent, not ASCII digits), so they are called
+# only for values which full match literal
+BOOL_LITERAL = '[A-Za-z]{4,5}'
+INT_LITERAL = '[+-]?[0-9]+'
+FLOAT_LITERAL = r'[+-]?[0-9]*\.?[0-9]+'
+BOOL_LITERAL_RE = re.compile(BOOL_LITERAL)
+INT_LITERAL_RE = re.compile(INT_LITERAL)
+FLOAT_LITERAL_RE = re.compile(FLOAT_LITERAL)
+
+# Fallback patterns for values which are not plain literals
+BOOL_RE = re.compile('[A-Za-z]{4,5}')
+INT_RE = re.compile('[-]?[0-9]+')
+FLOAT_RE = re.compile('[+-]?[0-9]*.[0-9]+|[0-9]+')
+NUMBER_RE = re.compile('[-]?[0-9]*.[0-9]+|[0-9]+')
+
+CastResult = namedtuple("CastResult", ("values", "errors"))
+
+
 def check_input_value(func):
     @functools.wraps(func)
     def wrapper(value: str):
@@ -40,6 +67,28 @@ def check_input_value(func):
     return wrapper
 
 
+# Letters and underscores of "nan", "inf", exponent or "1_000", which constructors accept but literals don't
+NOT_NUMBER_RE = re.compile('[A-Za-z_]')
+BOOL_COLUMN_RE = re.compile('(?:%s)(?:\n(?:%s))*' % (BOOL_LITERAL, BOOL_LITERAL))
+
+
+def _plain_numbers(text: str) -> bool:
+    """ ``text`` has no characters, which ``int``, ``float`` and ``Decimal`` accept beyond plain literals """
+    return text.isascii() and NOT_NUMBER_RE.search(text) is None
+
+
+def _plain_bools(text: str) -> bool:
+    return BOOL_COLUMN_RE.fullmatch(text) is not None
+
+
+def _search(pattern, value: str) -> str:
+    """ First match of precompiled ``pattern`` in ``value`` """
+    match = pattern.search(value)
+    if match is None:
+        raise ValueError(f"Cannot convert {value!r}")
+    return match.group()
+
+
 @check_input_value
 def cast_to_bool(value: str):
     """ Convert string value to boolean
@@ -54,32 +103,15 @@ def cast_to_bool(value: str):
         TypeError: If 'value' is not str.
         ValueError: If `value` is not equal to `bool` after transformation.
     """
-    boolean = re.findall('[A-Za-z]{4,5}', value)
-    if boolean:
-        boolean = boolean[0].lower()
-    else:
-        raise ValueError
-    if boolean == 'true':
-        return True
-    elif boolean == 'false':
-        return False
-    else:
-        raise ValueError
-
-
-print(cast_to_bool.__doc__)
-try:
-    print(cast_to_bool("true"))
-    print(cast_to_bool("TruE"))
-    print(cast_to_bool("fALse"))
-    print(cast_to_bool(" fALse\t"))
-    print(cast_to_bool("Yes"))
-except ValueError as v_error:
-    print(v_error)
-    print("Value error at cast_to_bool\n")
-except TypeError as t_error:
-    print(t_error)
-    print("TypeError at cast_to_bool\n")
+    stripped = value.strip()
+    if BOOL_LITERAL_RE.fullmatch(stripped):
+        boolean = BOOLS.get(stripped.lower())
+        if boolean is not None:
+            return boolean
+    boolean = BOOLS.get(_search(BOOL_RE, value).lower())
+    if boolean is None:
+        raise ValueError(f"Cannot convert {value!r} to bool")
+    return boolean
 
 
 @check_input_value
@@ -96,29 +128,10 @@ def cast_to_int(value: str):
         TypeError: If 'value' is not str.
         ValueError: If `value` is not equal to `int` after transformation.
     """
-    int_value = re.findall('[-]?[0-9]+', value)
-    if int_value:
-        int_value = int(int_value[0])
-    else:
-        raise ValueError
-    if isinstance(int_value, int):
-        return int_value
-    else:
-        raise ValueError
-
-
-print(cast_to_int.__doc__)
-try:
-    print(cast_to_int("1"))
-    print(cast_to_int("1234567890987654321"))
-    print(cast_to_int(" -1\t"))
-    print(cast_to_int("one"))
-except ValueError as v_error:
-    print(v_error)
-    print("Value error at cast_to_int\n")
-except TypeError as t_error:
-    print(t_error)
-    print("TypeError at cast_to_int\n")
+    stripped = value.strip()
+    if INT_LITERAL_RE.fullmatch(stripped):
+        return int(stripped)
+    return int(_search(INT_RE, value))
 
 
 @check_input_value
@@ -135,29 +148,10 @@ def cast_to_float(value: str):
         TypeError: If 'value' is not str.
         ValueError: If `value` is not equal to `float` after transformation.
     """
-    float_value = re.findall('[+-]?[0-9]*.[0-9]+|[0-9]+', value)
-    if float_value:
-        float_value = float(float_value[0])
-    else:
-        raise ValueError
-    if isinstance(float_value, float):
-        return float_value
-    else:
-        raise ValueError
-
-
-print(cast_to_float.__doc__)
-try:
-    print(cast_to_float("1"))
-    print(cast_to_float("123456789.0987654321"))  # output 123456789.09876543
-    print(cast_to_float(" -111.111\t"))
-    print(cast_to_float("PI"))
-except ValueError as v_error:
-    print(v_error)
-    print("Value error at cast_to_float\n")
-except TypeError as t_error:
-    print(t_error)
-    print("TypeError at cast_to_float\n")
+    stripped = value.strip()
+    if FLOAT_LITERAL_RE.fullmatch(stripped):
+        return float(stripped)
+    return float(_search(FLOAT_RE, value))
 
 
 @check_input_value
@@ -174,26 +168,170 @@ def cast_to_number(value: str):
         TypeError: If 'value' is not str.
         ValueError: If `value` is not equal to `decimal.Decimal` after transformation.
     """
-    dec_value = re.findall('[-]?[0-9]*.[0-9]+|[0-9]+', value)
-    if dec_value:
-        dec_value = decimal(dec_value[0])
-    else:
-        raise ValueError
-    if isinstance(dec_value, decimal):
-        return dec_value
-    else:
-        raise ValueError
-
-
-print(cast_to_number.__doc__)
-try:
-    print(cast_to_number("1"))
-    print(cast_to_number("123456789.0987654321"))
-    print(cast_to_number(" -111.111\t"))
-    print(cast_to_number("PI"))
-except ValueError as v_error:
-    print(v_error)
-    print("Value error at cast_to_number\n")
-except TypeError as t_error:
-    print(t_error)
-    print("TypeError at cast_to_number\n")
+    stripped = value.strip()
+    if FLOAT_LITERAL_RE.fullmatch(stripped):
+        return decimal(stripped)
+    try:
+        return decimal(_search(NUMBER_RE, value))
+    except ArithmeticError:
+        raise ValueError(f"Cannot convert {value!r} to decimal.Decimal") from None
+
+
+def _parse_bool(value: str) -> bool:
+    return BOOLS[value.lower()]
+
+
+def _literals(values, plain):
+    """ Stripped ``values`` if ``plain`` check of them joined by newlines passed, otherwise None """
+    try:
+        # str.strip raise TypeError for not str values, they are left for scalar casts
+        stripped = list(map(str.strip, values))
+    except TypeError:
+        return None
+    if not plain("\n".join(stripped)):
+        return None
+    return stripped
+
+
+def _cast_many(values, parse, cast, plain) -> CastResult:
+    """ Convert column ``values`` by one C level pass of ``parse`` over stripped values,
+    if all of them are plain literals by one ``plain`` check. Constructor accept only plain literals then,
+    which it converts the same manner as scalar casts do.
+    Otherwise values are converted one by one by scalar ``cast``
+    """
+    if not isinstance(values, (list, tuple)):
+        values = list(values)
+    stripped = _literals(values, plain)
+    if stripped is not None:
+        try:
+            return CastResult(list(map(parse, stripped)), {})
+        except (ValueError, KeyError, ArithmeticError):
+            # e.g. "1.2.3" or newline inside of value
+            pass
+    results = []
+    errors = {}
+    for i, value in enumerate(values):
+        try:
+            results.append(cast(value))
+        except (ValueError, TypeError) as ex:
+            results.append(None)
+            errors[i] = ex
+    return CastResult(results, errors)
+
+
+def _to_numpy(values, result: CastResult, dtype, plain=None):
+    """ Convert column by numpy, bad values of column replaced by NaN """
+    if numpy is None:
+        raise RuntimeError("Install 'numpy' package to return column as numpy array")
+    if result is None:
+        stripped = _literals(values, plain)
+        if stripped is None:
+            return None
+        try:
+            return CastResult(numpy.asarray(stripped, dtype=str).astype(dtype), {})
+        except (ValueError, TypeError, OverflowError):
+            return None
+    values = result.values
+    if result.errors:
+        values, dtype = [numpy.nan if v is None else v for v in values], float
+    try:
+        return CastResult(numpy.array(values, dtype=dtype), result.errors)
+    except OverflowError:
+        # Values out of range of dtype, e.g. integers beyond int64
+        return CastResult(numpy.array(values, dtype=object), result.errors)
+
+
+def cast_many_bool(values) -> CastResult:
+    """ Convert column of string values to booleans, see ``cast_to_bool``
+
+    Args:
+        values: iterable of values to convert
+
+    Returns:
+        CastResult: list of converted values (None for bad values) and
+            dictionary of index of bad value to its exception (TypeError or ValueError)
+    """
+    return _cast_many(values, _parse_bool, cast_to_bool, _plain_bools)
+
+
+def cast_many_int(values, as_numpy: bool = False) -> CastResult:
+    """ Convert column of string values to integers, see ``cast_to_int``
+
+    Args:
+        values: iterable of values to convert
+        as_numpy: return numpy array of int64 (float64 with NaN for bad values,
+            objects for values out of range). Default: False
+
+    Returns:
+        CastResult: list of converted values (None for bad values) and
+            dictionary of index of bad value to its exception (TypeError or ValueError)
+    """
+    if as_numpy:
+        values = list(values)
+        result = _to_numpy(values, None, numpy.int64 if numpy is not None else None, _plain_numbers)
+        if result is not None:
+            return result
+        return _to_numpy(values, _cast_many(values, int, cast_to_int, _plain_numbers), numpy.int64)
+    return _cast_many(values, int, cast_to_int, _plain_numbers)
+
+
+def cast_many_float(values, as_numpy: bool = False) -> CastResult:
+    """ Convert column of string values to floats, see ``cast_to_float``
+
+    Args:
+        values: iterable of values to convert
+        as_numpy: return numpy array of float64 (NaN for bad values). Default: False
+
+    Returns:
+        CastResult: list of converted values (None for bad values) and
+            dictionary of index of bad value to its exception (TypeError or ValueError)
+    """
+    if as_numpy:
+        values = list(values)
+        result = _to_numpy(values, None, numpy.float64 if numpy is not None else None, _plain_numbers)
+        if result is not None:
+            return result
+        return _to_numpy(values, _cast_many(values, float, cast_to_float, _plain_numbers), numpy.float64)
+    return _cast_many(values, float, cast_to_float, _plain_numbers)
+
+
+def cast_many_number(values) -> CastResult:
+    """ Convert column of string values to decimal.Decimal, see ``cast_to_number``
+
+    Args:
+        values: iterable of values to convert
+
+    Returns:
+        CastResult: list of converted values (None for bad values) and
+            dictionary of index of bad value to its exception (TypeError or ValueError)
+    """
+    return _cast_many(values, decimal, cast_to_number, _plain_numbers)
+
+
+if __name__ == "__main__":
+    for cast, samples in (
+        (cast_to_bool, ("true", "TruE", "fALse", " fALse\t", "Yes")),
+        (cast_to_int, ("1", "1234567890987654321", " -1\t", "one")),
+        (cast_to_float, ("1", "123456789.0987654321", " -111.111\t", "PI")),
+        (cast_to_number, ("1", "123456789.0987654321", " -111.111\t", "PI")),
+    ):
+        print(cast.__doc__)
+        try:
+            for sample in samples:
+                print(cast(sample))
+        except ValueError as v_error:
+            print(v_error)
+            print("Value error at %s\n" % cast.__name__)
+        except TypeError as t_error:
+            print(t_error)
+            print("TypeError at %s\n" % cast.__name__)
+
+    import timeit
+
+    column = [" %d " % i for i in range(100000)] + ["bad", None]
+    result = cast_many_int(column)
+    print("errors:", result.errors)
+    print("cast_to_int per value: %.3f sec" % min(timeit.repeat(
+        lambda: [cast_to_int(value) for value in column[:-2]], number=1, repeat=3)))
+    print("cast_many_int:         %.3f sec" % min(timeit.repeat(
+        lambda: cast_many_int(column[:-2]), number=1, repeat=3)))
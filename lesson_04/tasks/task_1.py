@@ -1,5 +1,5 @@
-from typing import Dict
-import copy
+from typing import Dict, Iterable, Iterator
+from itertools import islice
 
 """ Task 1: Create function which return copy (!!!) of dictionary without selected keys
 
@@ -21,31 +21,56 @@ Requirement:
 """
 
 
-def find_key(d: Dict, key: str):
-    try:
-        message = d.pop(key, None)
-        if not message:
-            raise KeyError
-    except KeyError:
-        for value in d.values():
-            if isinstance(value, dict):
-                find_key(value, key)
+def _del_keys(d: Dict, keys: frozenset) -> Dict:
+    """ Copy-on-write removal of ``keys`` at every level of nested dictionaries
+
+    Returns:
+        ``d`` itself if it does not contain any of ``keys``, otherwise new dictionary
+        which share all untouched values and nested dictionaries with ``d``
+    """
+    new_d = None
+    for i, (key, value) in enumerate(d.items()):
+        if key in keys:
+            if new_d is None:
+                new_d = dict(islice(d.items(), i))
+            continue
+        if isinstance(value, dict) and value:
+            new_value = _del_keys(value, keys)
+            if new_value is not value and new_d is None:
+                new_d = dict(islice(d.items(), i))
+            value = new_value
+        if new_d is not None:
+            new_d[key] = value
+    return d if new_d is None else new_d
 
 
 def del_dict_keys(dictionary: Dict, *keys: str) -> Dict:
     """ Delete keys from dictionary
     Function print:
         dictionary after transformation
+    Only dictionaries on the path to deleted keys are copied, untouched nested values are shared
+    with ``dictionary``, so result should not be modified in place.
     Args:
         dictionary: dictionary to remove keys
         *keys: Variable length argument list.
     Returns:
         dictionary without selected keys
     """
-    new_d = copy.deepcopy(dictionary)
-    for key in keys:
-        find_key(new_d, key)
-    return new_d
+    new_d = _del_keys(dictionary, frozenset(keys))
+    return dict(new_d) if new_d is dictionary else new_d
+
+
+def del_dict_keys_many(records: Iterable[Dict], *keys: str) -> Iterator[Dict]:
+    """ Delete keys from every dictionary of stream of records
+    Key set compiled once. Records without selected keys returned as is (not copied).
+    Args:
+        records: iterable of dictionaries
+        *keys: Variable length argument list.
+    Returns:
+        iterator of dictionaries without selected keys
+    """
+    keys = frozenset(keys)
+    return (_del_keys(record, keys) for record in records)
 
 
 if __name__ == "__main__":
@@ -1,4 +1,5 @@
-from typing import Dict, Union
+import re
+from typing import Callable, Dict, Union
 
 """ Task 2: Create function which find and return values into dict / nested dict
 
@@ -62,10 +63,137 @@ def get_dict_value(dictionary: Dict, *keys: str, default: int = None, errors: st
             return None
 
 
+PATH_RE = re.compile(r"(?:[^.\[\]]+|\[-?\d+\])(?:\.[^.\[\]]+|\[-?\d+\])*")
+SEGMENT_RE = re.compile(r"([^.\[\]]+)|\[(-?\d+)\]")
+LOOKUP_ERRORS = (KeyError, IndexError, TypeError)
+_MISSING = object()
+
+
+def parse_path(path) -> tuple:
+    """ Split path into keys
+    Args:
+        path: dotted path with list indices in brackets ('a.b[0].c') or tuple / list of keys
+    Returns:
+        tuple of keys, list indices are integers
+    """
+    if isinstance(path, (tuple, list)):
+        return tuple(path)
+    if not isinstance(path, str) or not PATH_RE.fullmatch(path):
+        raise ValueError(f"Invalid key path {path!r}")
+    return tuple(key if index is None or key else int(index) for key, index in SEGMENT_RE.findall(path))
+
+
+def _path_name(keys: tuple) -> str:
+    return "".join("[%d]" % key if isinstance(key, int) else ".%s" % key for key in keys).lstrip(".")
+
+
+def _literal(key, namespace: Dict) -> str:
+    """ Source code of key: literal for str and int, name of constant otherwise """
+    if type(key) in (str, int):
+        return repr(key)
+    name = "_k%d" % len(namespace)
+    namespace[name] = key
+    return name
+
+
+def _check_errors(errors: str):
+    if errors not in ('ignore', 'strict'):
+        raise ValueError(f"Unknown errors {errors!r}, should be 'ignore' or 'strict'")
+
+
+def compile_path(path, default=None, errors: str = 'ignore') -> Callable:
+    """ Compile key path into reusable accessor
+    Args:
+        path: dotted path with list indices in brackets ('a.b[0].c') or tuple / list of keys
+        default: value to return if key path doesnt exists
+        errors: 'ignore' to return ``default``, 'strict' to raise KeyError if key path doesnt exists
+    Returns:
+        function of one argument - dictionary, which return value of key path
+    Example:
+        >>> get_id = compile_path('payload.commits[0].sha')
+        >>> [get_id(event) for event in events]
+    """
+    _check_errors(errors)
+    keys = parse_path(path)
+    if not keys:
+        raise ValueError("Key path should contain at least one key")
+    namespace = {"_default": default, "_errors": LOOKUP_ERRORS}
+    expression = "d" + "".join("[%s]" % _literal(key, namespace) for key in keys)
+    if errors == 'strict':
+        missing = "raise KeyError(%r) from None" % f"Key path {_path_name(keys)!r} not exists"
+    else:
+        missing = "return _default"
+    source = "def get(d):\n    try:\n        return %s\n    except _errors:\n        %s\n" % (expression, missing)
+    exec(source, namespace)
+    return namespace["get"]
+
+
+def compile_paths(*paths, default=None, errors: str = 'ignore') -> Callable:
+    """ Compile many key paths into one extractor which walk common prefixes of paths once
+    Args:
+        *paths: dotted paths with list indices in brackets ('a.b[0].c') or tuples / lists of keys
+        default: value for key path which doesnt exists
+        errors: 'ignore' to use ``default``, 'strict' to raise KeyError if any key path doesnt exists
+    Returns:
+        function of one argument - dictionary, which return tuple of values in order of ``paths``
+    Example:
+        >>> extract = compile_paths('id', 'actor.login', 'payload.commits[0].sha')
+        >>> rows = [extract(event) for event in events]
+    """
+    _check_errors(errors)
+    namespace = {"_default": default, "_errors": LOOKUP_ERRORS, "_MISSING": _MISSING}
+    nodes = {(): "d"}
+    lines = ["def extract(d):"]
+    results = []
+    for path in paths:
+        keys = parse_path(path)
+        if not keys:
+            raise ValueError("Key path should contain at least one key")
+        for i in range(1, len(keys) + 1):
+            prefix = keys[:i]
+            if prefix in nodes:
+                continue
+            parent = nodes[keys[:i - 1]]
+            name = nodes[prefix] = "n%d" % len(nodes)
+            lines.append("    %s = _MISSING" % name)
+            lines.append("    if %s is not _MISSING:" % parent)
+            lines.append("        try:")
+            lines.append("            %s = %s[%s]" % (name, parent, _literal(keys[i - 1], namespace)))
+            lines.append("        except _errors:")
+            lines.append("            pass")
+        results.append((nodes[keys], _path_name(keys)))
+    if errors == 'strict':
+        for name, path_name in results:
+            lines.append("    if %s is _MISSING:" % name)
+            lines.append("        raise KeyError(%r)" % f"Key path {path_name!r} not exists")
+        values = ", ".join(name for name, _ in results)
+    else:
+        values = ", ".join("_default if %s is _MISSING else %s" % (name, name) for name, _ in results)
+    lines.append("    return (%s%s)" % (values, "," if len(results) == 1 else ""))
+    exec("\n".join(lines) + "\n", namespace)
+    return namespace["extract"]
+
+
 if __name__ == "__main__":
     d = {'a': {'b': {'c': 1, 'd': {'h': 4}}, 'e': 3}, 'f': {'c': 1, 'd': 2}, 'g': {'l': {'h': 5}, 'k': 5}}
     print(get_dict_value(d, 'a', 'b', 'd'))
     print(get_dict_value(d, 'xxx'))
     print(get_dict_value(d, 'a', 'b', 'z'))
     print(get_dict_value(d, 'a', 'b', 'z', default=42))
+    import timeit
+
+    event = {'id': 1, 'actor': {'login': 'user', 'id': 2}, 'payload': {'commits': [{'sha': 'abc', 'size': 1}]}}
+    get_sha = compile_path('payload.commits[0].sha')
+    extract = compile_paths('id', 'actor.login', 'actor.id', 'payload.commits[0].sha', 'payload.size')
+    print(get_sha(event), extract(event))
+    for name, func in (
+            ("get_dict_value", lambda: get_dict_value(event, 'actor', 'login')),
+            ("compile_path", (lambda get=compile_path('actor.login'): get(event))),
+            ("get_dict_value x4", lambda: [get_dict_value(event, 'id'), get_dict_value(event, 'actor', 'login'),
+                                           get_dict_value(event, 'actor', 'id'),
+                                           get_dict_value(event, 'payload', 'size')]),
+            ("compile_paths x4", (lambda ex=compile_paths('id', 'actor.login', 'actor.id', 'payload.size'): ex(event))),
+    ):
+        print("%-20s %.3f sec" % (name, min(timeit.repeat(func, number=1000000, repeat=3))))
+
     print(get_dict_value(d, 'a', 'b', 'z', default=42, errors='strict'))
@@ -1,4 +1,5 @@
 from abc import ABCMeta, abstractmethod
+from collections import OrderedDict, namedtuple
 import re
 from decimal import Decimal as decimal
 from decimal import InvalidOperation
@@ -96,6 +97,111 @@ class NumberCastType(BaseCastType):
             raise ValueError(f"ValueError with {dec}")
 
 
+CacheStats = namedtuple("CacheStats", ("hits", "misses", "size", "enabled"))
+
+
+class CachedCastType(BaseCastType):
+    """Memoise results of caster for columns with few distinct values
+
+    Successfully converted values are kept in bounded cache, so repeated value costs one dict lookup.
+    After ``probe`` calls cache turn itself off if ratio of hits less than ``min_hit_ratio``
+    (cardinality of column is high) and every value is passed to caster directly.
+
+    Args:
+        caster: caster to wrap, e.g. ``IntCastType()``
+        maxsize: maximal number of cached values. Default 1024
+        policy: eviction policy "lru" (least recently used) or "lfu" (least frequently used). Default "lru".
+            LFU keeps keys in buckets by number of hits, so eviction is O(1) as for LRU
+        probe: number of calls before check of hit ratio. Default 10000
+        min_hit_ratio: minimal ratio of hits to keep cache enabled. Default 0.5
+    """
+
+    def __init__(self, caster, maxsize: int = 1024, policy: str = "lru", probe: int = 10000,
+                 min_hit_ratio: float = 0.5):
+        if policy not in ("lru", "lfu"):
+            raise ValueError(f"Unknown cache policy {policy!r}")
+        self.caster = caster
+        self.maxsize = maxsize
+        self.policy = policy
+        self.probe = probe
+        self.min_hit_ratio = min_hit_ratio
+        self.hits = 0
+        self.misses = 0
+        self._cache = OrderedDict() if policy == "lru" else {}
+        self._counts = {} if policy == "lfu" else None
+        # LFU: number of hits -> keys with this number in order of the last hit, and the least number
+        self._buckets = {}
+        self._min_count = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self._cache is not None
+
+    @property
+    def stats(self) -> CacheStats:
+        """Statistics of cache: hits, misses, size, enabled"""
+        return CacheStats(self.hits, self.misses, len(self._cache or ()), self.enabled)
+
+    def __call__(self, values):
+        cache = self._cache
+        if cache is None:
+            return self.caster(values)
+        try:
+            result = cache[values]
+        except KeyError:
+            return self._miss(values)
+        except TypeError:
+            # unhashable value, caster raise proper error
+            return self.caster(values)
+        self.hits += 1
+        if self._counts is None:
+            cache.move_to_end(values)
+        else:
+            self._count_hit(values)
+        return result
+
+    def _count_hit(self, values):
+        """Move key of LFU cache into bucket of the next number of hits"""
+        count = self._counts[values]
+        bucket = self._buckets[count]
+        del bucket[values]
+        if not bucket:
+            del self._buckets[count]
+            if self._min_count == count:
+                self._min_count = count + 1
+        self._counts[values] = count + 1
+        try:
+            self._buckets[count + 1][values] = None
+        except KeyError:
+            self._buckets[count + 1] = OrderedDict.fromkeys((values,))
+
+    def _miss(self, values):
+        self.misses += 1
+        if self.misses + self.hits >= self.probe and self.hits < self.min_hit_ratio * (self.misses + self.hits):
+            self._cache = self._counts = self._buckets = None
+            return self.caster(values)
+        result = self.caster(values)
+        cache = self._cache
+        if len(cache) >= self.maxsize:
+            if self._counts is None:
+                cache.popitem(last=False)
+            else:
+                bucket = self._buckets[self._min_count]
+                rare, _ = bucket.popitem(last=False)
+                if not bucket:
+                    del self._buckets[self._min_count]
+                del cache[rare], self._counts[rare]
+        cache[values] = result
+        if self._counts is not None:
+            self._counts[values] = 1
+            self._min_count = 1
+            try:
+                self._buckets[1][values] = None
+            except KeyError:
+                self._buckets[1] = OrderedDict.fromkeys((values,))
+        return result
+
+
 if __name__ == '__main__':
     boolean = BoolCastType()
     try:
@@ -131,6 +237,15 @@ if __name__ == '__main__':
     except TypeError as t_error:
         print(t_error)
 
+    import random
+    import timeit
+
+    column = [random.choice(["true", "false", " True "]) for _ in range(100000)]
+    cached = CachedCastType(BoolCastType())
+    for name, caster in (("BoolCastType", BoolCastType()), ("CachedCastType", cached)):
+        print("%-15s %.3f sec" % (name, min(timeit.repeat(lambda: list(map(caster, column)), number=1, repeat=3))))
+    print(cached.stats)
+
     dec = NumberCastType()
     try:
         print(dec("1"))
@@ -1,4 +1,7 @@
+import keyword
 from collections.abc import Mapping
+from operator import attrgetter
+from types import MappingProxyType
 
 """ Task 4: Create class ExtendedMapping which allow to call mapping key as attribute
 
@@ -38,40 +41,187 @@ Requirement:
 """
 
 
+_MISSING = object()
+
+
 class ExtendedMapping(Mapping):
+    """ Read-only attribute access to keys of mapping
+
+    Construction is O(1): keys validated on first access (or iteration), nested mappings wrapped
+    into ExtendedMapping on first access. Validated values and wrappers cached, so repeated access cost
+    one dict lookup and return the same object. Cache created on first access, so wrapper which keys
+    were not accessed has no per-instance dict at all.
+    Original mapping should not be changed after wrapping.
+    """
+
+    __slots__ = ("m", "_cache")
+
+    # Shared empty cache of instances, which keys were not accessed yet
+    _empty_cache = MappingProxyType({})
+
     def __init__(self, m):
         if not isinstance(m, Mapping):
             raise TypeError
-        self.check_values(m)
         self.m = m
+        self._cache = self._empty_cache
+
+    @staticmethod
+    def check_key(key):
+        if not isinstance(key, str) or not key.isidentifier():
+            raise ValueError(f"'{key}' not valid Python identifier")
 
-    def check_values(self, d: Mapping):
-        for key, value in d.items():
-            if not isinstance(key, str) or not key.isidentifier():
-                raise ValueError(f"'{key}' not valid Python identifier")
-            if isinstance(value, dict):
+    def check_values(self, d: Mapping = None):
+        """ Validate all keys of mapping and nested mappings at once """
+        for key, value in (self.m if d is None else d).items():
+            self.check_key(key)
+            if isinstance(value, Mapping):
                 self.check_values(value)
 
+    def _load(self, key):
+        """ Validate key, wrap nested mapping and cache value """
+        value = self.m[key]
+        self.check_key(key)
+        if isinstance(value, Mapping) and not isinstance(value, ExtendedMapping):
+            value = ExtendedMapping(value)
+        if self._cache is self._empty_cache:
+            self._cache = {}
+        self._cache[key] = value
+        return value
+
     def __len__(self) -> int:
         return len(self.m)
 
     def __iter__(self) -> Mapping:
-        yield from self.m
+        check_key = self.check_key
+        for key in self.m:
+            check_key(key)
+            yield key
+
+    def __contains__(self, key) -> bool:
+        return key in self.m
 
-    def __getitem__(self, key: str) -> int:
+    def __getitem__(self, key: str):
         try:
-            return self.m[key]
+            value = self._cache.get(key, _MISSING)
+        except TypeError:
+            raise ValueError(f"'{key}' not valid Python identifier")
+        if value is not _MISSING:
+            return value
+        try:
+            return self._load(key)
         except KeyError:
             raise KeyError(f"'ExtendedMapping' object has no key: '{key}'")
 
     def __getattr__(self, item):
+        value = self._cache.get(item, _MISSING)
+        if value is not _MISSING:
+            return value
         try:
-            return self.m[item]
+            return self._load(item)
         except KeyError:
             raise AttributeError(f"'ExtendedMapping' object has no attribute: '{item}'")
 
-    # def __getattribute__(self, name: str) -> int:
-    #     return self.m[name]
+    def __repr__(self) -> str:
+        return f"ExtendedMapping({self.m!r})"
+
+
+# (class name, field names) -> record class, so unpickled records reuse one class per process
+_record_classes = {}
+# Field stored in slot with the same name, so it would replace method of mapping interface
+_reserved_fields = frozenset(dir(Mapping))
+
+
+def _field_name(field) -> str:
+    """ Name of field: string or first item of column description (``cursor.description``) """
+    return field if isinstance(field, str) else getattr(field, "name", None) or field[0]
+
+
+def _restore_record(name: str, fields: tuple, values: tuple):
+    return record_class(name, fields)(*values)
+
+
+def record_class(name: str, fields) -> type:
+    """ Create immutable record type with fixed set of keys
+
+    Values stored in ``__slots__`` of object, without dict per record, so record take a fraction of memory
+    of dict. Record has attribute access (``r.a``), read-only mapping interface (``r["a"]``, ``keys()``,
+    ``items()``, ..), hashable and picklable. Classes cached by name and fields.
+
+    Args:
+        name: name of class
+        fields: field names: CSV header, ``cursor.description`` or any iterable of strings
+
+    Returns:
+        class, which instances created by values in order of fields ``Record(1, 2)``,
+        from iterable ``Record._make(row)`` or from mapping ``Record._from_mapping(d)``
+
+    Raises:
+        ValueError: If field not valid Python identifier, starts with underscore, duplicated
+            or collides with method of Mapping (``keys``, ``items``, ``get``, ..)
+    """
+    fields = tuple(_field_name(field) for field in fields)
+    try:
+        return _record_classes[name, fields]
+    except KeyError:
+        pass
+    for field in fields:
+        if not isinstance(field, str) or not field.isidentifier() or keyword.iskeyword(field):
+            raise ValueError(f"'{field}' not valid Python identifier")
+        if field.startswith("_"):
+            raise ValueError(f"Field '{field}' should not start with underscore")
+        if field in _reserved_fields:
+            raise ValueError(f"Field '{field}' collides with Mapping method '{field}'")
+    if len(set(fields)) != len(fields):
+        raise ValueError(f"Duplicated fields: {fields}")
+
+    getters = {field: attrgetter(field) for field in fields}
+    if len(fields) > 1:
+        values_getter = attrgetter(*fields)
+    else:
+        values_getter = lambda self: tuple(getattr(self, field) for field in fields)  # noqa: E731
+
+    def __getitem__(self, key):
+        try:
+            return getters[key](self)
+        except (KeyError, TypeError):
+            raise KeyError(key) from None
+
+    def __setattr__(self, key, value=None):
+        raise AttributeError(f"'{name}' object is immutable")
+
+    namespace = {
+        "__slots__": fields,
+        "_fields": fields,
+        "__getitem__": __getitem__,
+        "__len__": lambda self: len(fields),
+        "__iter__": lambda self: iter(fields),
+        "__contains__": lambda self, key: key in getters,
+        "__setattr__": __setattr__,
+        "__delattr__": __setattr__,
+        "__eq__": lambda self, other: (values_getter(self) == values_getter(other) if type(other) is type(self)
+                                       else Mapping.__eq__(self, other)),
+        "__hash__": lambda self: hash(values_getter(self)),
+        "__reduce__": lambda self: (_restore_record, (name, fields, values_getter(self))),
+        "__repr__": lambda self: "%s(%s)" % (name, ", ".join("%s=%r" % item
+                                                             for item in zip(fields, values_getter(self)))),
+        "_astuple": values_getter,
+        "_asdict": lambda self: dict(zip(fields, values_getter(self))),
+        "_make": classmethod(lambda cls, iterable: cls(*iterable)),
+        "_from_mapping": classmethod(lambda cls, m: cls(*[m[field] for field in fields])),
+    }
+    cls = type(name, (Mapping,), namespace)
+
+    # Values assigned by slot descriptors directly, because __setattr__ is disabled
+    init_namespace = {"_set%d" % i: getattr(cls, field).__set__ for i, field in enumerate(fields)}
+    # Fields can't start with underscore, so "_self" never collide with field, e.g. "self" column of CSV
+    source = "def __init__(_self%s):\n%s    pass\n" % (
+        "".join(", " + field for field in fields),
+        "".join("    _set%d(_self, %s)\n" % (i, field) for i, field in enumerate(fields)),
+    )
+    exec(source, init_namespace)
+    cls.__init__ = init_namespace["__init__"]
+    _record_classes[name, fields] = cls
+    return cls
 
 
 if __name__ == '__main__':
@@ -79,6 +229,7 @@ if __name__ == '__main__':
     em1 = ExtendedMapping(d1)
     print(em1['a'])
     print(em1.a)
+    print(em1.a.b.c)
     # print(em1['a1'])
     print(em1.a1)
     # d2 = {'2key': {'b': {'c': 1, 'd': 2}, 'e': 3}, 'a': 4}
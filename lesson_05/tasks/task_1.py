@@ -1,6 +1,12 @@
 import csv
-from collections import deque
-from itertools import islice
+import locale
+import os
+import queue
+import re
+import threading
+from collections import deque, namedtuple
+from functools import partial
+from itertools import chain, islice
 
 csv.field_size_limit(2 ** 31 - 1)
 """ Task 1: CSV to Dict Iterator with context manager support
@@ -69,11 +75,110 @@ def skip_line(file, start: int, footer: int):
             yield waste.popleft()
 
 
+PREFETCH_MODES = (None, "blocks", "rows")
+BLOCK_SIZE = 1024 * 1024  # bytes (characters in text mode) of raw block read by background thread
+BATCH_SIZE = 1000  # number of parsed rows passed by background thread at once
+_END = object()
+
+
+class Prefetcher:
+    """Iterate ``iterable`` in background thread and pass its items to consumer through bounded queue
+
+    Background thread blocks when queue is full, so at most ``queue_size`` items are read ahead.
+    Exception raised by ``iterable`` re-raised in consumer thread.
+    """
+
+    def __init__(self, iterable, queue_size: int = 4):
+        self.queue = queue.Queue(queue_size)
+        self.stopped = threading.Event()
+        self.finished = False
+        self.thread = threading.Thread(target=self._produce, args=(iter(iterable),), daemon=True)
+        self.thread.start()
+
+    def _put(self, item) -> bool:
+        while not self.stopped.is_set():
+            try:
+                self.queue.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def _produce(self, iterator):
+        try:
+            for item in iterator:
+                if not self._put(item):
+                    return
+        except BaseException as ex:
+            self._put((_END, ex))
+        else:
+            self._put((_END, None))
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        if self.finished:
+            raise StopIteration
+        item = self.queue.get()
+        if type(item) is tuple and len(item) == 2 and item[0] is _END:
+            self.finished = True
+            self.thread.join()
+            if item[1] is not None:
+                raise item[1]
+            raise StopIteration
+        return item
+
+    def close(self):
+        """Stop background thread and drop items read ahead"""
+        self.finished = True
+        self.stopped.set()
+        self.thread.join()
+
+
+LONE_CR_RE = re.compile(rb"(?<=\r)(?!\n)")
+
+
+def iter_block_lines(blocks):
+    """Split text or binary blocks into lines the same manner as iteration of binary file does"""
+    pending = None
+    for block in blocks:
+        if pending is None:
+            pending = block[:0]
+            newline = "\n" if isinstance(block, str) else b"\n"
+        parts = (pending + block).split(newline)
+        pending = parts.pop()
+        yield from [part + newline for part in parts]
+    if pending:
+        yield pending
+
+
+def split_lone_cr(lines):
+    """Split binary lines at lone carriage returns, which are line ends in text mode too"""
+    for line in lines:
+        cr = line.find(b"\r")
+        if cr == -1 or (cr == len(line) - 2 and line.endswith(b"\r\n")):
+            yield line
+        else:
+            yield from (piece for piece in LONE_CR_RE.split(line) if piece)
+
+
+Checkpoint = namedtuple("Checkpoint", ("offset", "row_number", "fieldnames"))
+Checkpoint.__doc__ = """Position of DictReader after last returned row
+
+    offset: byte offset of beginning of next row
+    row_number: number of returned rows
+    fieldnames: field names or None if header not parsed yet
+"""
+
+
 class DictReader:
     """Read file and Convert csv row to  dict"""
 
     def __init__(self, fp: str, start_position: int = 0, header: bool = True,
-                 fieldnames: tuple = None, delimiter: str = ",", quotechar: str = '"', footer: int = 0):
+                 fieldnames: tuple = None, delimiter: str = ",", quotechar: str = '"', footer: int = 0,
+                 prefetch: str = None, queue_size: int = 4, block_size: int = BLOCK_SIZE, batch_size: int = BATCH_SIZE,
+                 checkpoint: Checkpoint = None, stop: int = None, encoding: str = None, track_offsets: bool = False):
         """ Initialize DictReader object
 
         Args:
@@ -84,9 +189,31 @@ class DictReader:
             delimiter: separator for field. String. Default ','
             quoter: Separator for big filed with delimiter. Default '"'
             footer: number of last lines to skip. Integer. Default 0
+            prefetch: read file in background thread. Default None - read in calling thread
+                "blocks": background thread read raw blocks of ``block_size`` bytes, parse in calling thread
+                "rows": background thread read and parse, pass batches of ``batch_size`` parsed rows
+            queue_size: maximal number of blocks / batches read ahead. Default 4
+            block_size: size of raw block in bytes. Default 1 MiB
+            batch_size: number of rows in batch. Default 1000
+            checkpoint: resume reading from checkpoint saved by ``DictReader.checkpoint()``.
+                ``start_position`` and ``header`` already applied by checkpoint. Default None
+            stop: stop at byte offset, e.g. offset of checkpoint which is start of next part of file
+                read by another worker. Footer skipped only if ``stop`` is beyond end of file. Default None
+            encoding: encoding of file. Default None - locale encoding as ``open`` does
+            track_offsets: track byte offsets of rows to call ``checkpoint()``. File read in binary mode and
+                decoded line by line, which is slower than text mode. Default False, True if ``checkpoint``
+                or ``stop`` passed
         """
+        if prefetch not in PREFETCH_MODES:
+            raise ValueError(f"Unknown prefetch mode {prefetch!r}, should be one of {PREFETCH_MODES}")
         self.filepath = fp
-        self.file = open(self.filepath, "r")
+        self.track_offsets = track_offsets or checkpoint is not None or stop is not None
+        if self.track_offsets:
+            self.file = open(self.filepath, "rb")
+            self.encoding = encoding or locale.getpreferredencoding(False)
+        else:
+            self.file = open(self.filepath, "r", encoding=encoding)
+            self.encoding = self.file.encoding
         self.lines = iter([])
         self.closed = False
         self.fieldnames = []
@@ -99,24 +226,113 @@ class DictReader:
         self.quotechar = quotechar
         self.footer = footer
         self.first_run = True
+        self.prefetch = prefetch
+        self.queue_size = queue_size
+        self.block_size = block_size
+        self.batch_size = batch_size
+        self.prefetcher = None
+        self.stop = stop
+        if stop is not None and stop < os.fstat(self.file.fileno()).st_size:
+            self.footer = 0
+        self.resumed = checkpoint is not None and checkpoint.fieldnames is not None
+        if checkpoint is None:
+            checkpoint = Checkpoint(0, 0, None)
+        self.offset, self.row_number = checkpoint.offset, checkpoint.row_number
+        if self.resumed:
+            self.fieldnames = list(checkpoint.fieldnames)
+            self.start_position = 0
+
+    def checkpoint(self) -> Checkpoint:
+        """Position after last returned row. Reader created with the checkpoint continue from the next row"""
+        if not self.track_offsets:
+            raise ValueError("Create DictReader with track_offsets=True to save checkpoints")
+        if self.first_run and not self.resumed:
+            # reading not started, ``start_position`` and header are not applied yet
+            return Checkpoint(0, 0, None)
+        fieldnames = None if self.fieldnames is None else tuple(self.fieldnames)
+        return Checkpoint(self.offset, self.row_number, fieldnames)
+
+    def parse(self, lines):
+        """Skip first / last lines and parse CSV rows
+
+        Args
+            lines: iterator of text lines
+        Returns
+            Iterator of parsed rows
+        """
+        lines = skip_line(lines, self.start_position, self.footer)
+        return csv.reader(lines, delimiter=self.delimiter, quotechar=self.quotechar)
+
+    def parse_tracked(self, lines):
+        """Skip first / last lines, decode and parse CSV rows
+
+        Args
+            lines: iterator of binary lines starting at ``self.offset``
+        Returns
+            Generator of tuples (offset of end of row, parsed row)
+        """
+        lines = split_lone_cr(lines)
+        offset = self.offset
+        for line in islice(lines, self.start_position):
+            offset += len(line)
+        lines = skip_line(lines, 0, self.footer)
+        encoding, stop = self.encoding, self.stop
+
+        def texts():
+            nonlocal offset
+            for line in lines:
+                offset += len(line)
+                text = line.decode(encoding)
+                # translate line ends the same manner as text mode does
+                if text[-2:] == "\r\n":
+                    text = text[:-2] + "\n"
+                elif text[-1:] == "\r":
+                    text = text[:-1] + "\n"
+                yield text
+                if stop is not None and offset >= stop:
+                    return
+
+        for row in csv.reader(texts(), delimiter=self.delimiter, quotechar=self.quotechar):
+            yield offset, row
 
     def preparatory_work(self):
-        self.lines = skip_line(self.file, self.start_position, self.footer)
-        self.lines = csv.reader(self.lines, delimiter=self.delimiter, quotechar=self.quotechar)
+        if self.track_offsets:
+            self.file.seek(self.offset)
+        if self.prefetch == "blocks":
+            empty = b"" if self.track_offsets else ""
+            self.prefetcher = Prefetcher(iter(partial(self.file.read, self.block_size), empty), self.queue_size)
+            raw_lines = iter_block_lines(self.prefetcher)
+        else:
+            raw_lines = self.file
+        rows = self.parse_tracked(raw_lines) if self.track_offsets else self.parse(raw_lines)
+        if self.prefetch == "rows":
+            self.prefetcher = Prefetcher(iter(lambda: list(islice(rows, self.batch_size)), []), self.queue_size)
+            self.lines = chain.from_iterable(self.prefetcher)
+        else:
+            self.lines = rows
+        if self.resumed:
+            return
         if self.header is True:
             try:
-                self.fieldnames = next(self.lines)
+                self.fieldnames = self.next_row()
             except StopIteration:
                 return
         elif self.fieldnames is None:
             try:
-                row = next(self.lines)
+                row = self.next_row()
             except StopIteration:
                 return
             self.fieldnames = ["col%02d" % i for i in range(len(row))]
             self.first_row = dict(zip(self.fieldnames, row))
             self.first = True
 
+    def next_row(self) -> list:
+        """Next parsed row, offset of row saved if offsets tracked"""
+        if self.track_offsets:
+            self.offset, row = next(self.lines)
+            return row
+        return next(self.lines)
+
     def __iter__(self):
         return self
 
@@ -126,8 +342,10 @@ class DictReader:
             self.preparatory_work()
         if self.first is True:
             self.first = False
+            self.row_number += 1
             return self.first_row
-        item = next(self.lines)
+        item = self.next_row()
+        self.row_number += 1
         return dict(zip(self.fieldnames, item))
 
     def close(self):
@@ -135,6 +353,8 @@ class DictReader:
         if self.closed:
             raise OSError(f"File {self.filepath!r} already closed")
         self.closed = True
+        if self.prefetcher is not None:
+            self.prefetcher.close()
         self.file.close()
 
     def __enter__(self):
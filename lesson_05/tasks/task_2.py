@@ -1,7 +1,12 @@
 import csv
 from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from itertools import islice
 import requests
+from requests.adapters import HTTPAdapter
+from requests.utils import get_encoding_from_headers
+
+from lesson_05.tasks.task_1 import iter_block_lines
 
 csv.field_size_limit(2 ** 31 - 1)
 
@@ -78,11 +83,61 @@ def skip_line(file, start: int, footer: int):
             yield waste.popleft()
 
 
+RANGE_SIZE = 4 * 1024 * 1024  # bytes fetched by one range request
+CHUNK_SIZE = 64 * 1024  # bytes read at once from response of single request
+
+
+def decode_lines(blocks, encoding: str):
+    """Split binary blocks into lines and decode them
+
+    Line ends are kept, so ``csv`` keeps newlines inside of quoted fields
+    the same manner as for file opened with ``newline=""``.
+    """
+    for line in iter_block_lines(blocks):
+        yield line.decode(encoding)
+
+
+def supports_ranges(session: requests.Session, url: str):
+    """Check that server could return parts of ``url`` by HTTP Range requests
+
+    Returns:
+        tuple (size of body, encoding) or None if ranges not supported
+    """
+    try:
+        response = session.head(url, allow_redirects=True)
+    except requests.RequestException:
+        return None
+    headers = response.headers
+    if (response.status_code != 200 or headers.get("Accept-Ranges", "").lower() != "bytes"
+            or headers.get("Content-Encoding", "identity").lower() != "identity"):
+        return None
+    try:
+        size = int(headers["Content-Length"])
+    except (KeyError, ValueError):
+        return None
+    return size, get_encoding_from_headers(headers) or "utf-8"
+
+
 class DictReader:
     """Read via HTTP and Convert csv row to  dict"""
 
     def __init__(self, fp: str, start_position: int = 0, header: bool = True,
-                 fieldnames: tuple = None, delimiter: str = ",", quotechar: str = '"', footer: int = 0):
+                 fieldnames: tuple = None, delimiter: str = ",", quotechar: str = '"', footer: int = 0,
+                 connections: int = 1, range_size: int = RANGE_SIZE):
+        """ Initialize DictReader object
+
+        Args:
+            fp: URL of csv file. String
+            start_position: number of first lines to skip. Int. Default 0
+            header: Header in file . Boolean. Default True.
+            fieldnames: Header name. tuple of string. Default None.
+            delimiter: separator for field. String. Default ','
+            quotechar: Separator for big filed with delimiter. Default '"'
+            footer: number of last lines to skip. Integer. Default 0
+            connections: number of concurrent HTTP Range requests. If server does not support ranges
+                file downloaded by one request. Default 1 - one request
+            range_size: bytes fetched by one range request. Default 4 MiB
+        """
         self.url_path = fp
         self.lines = iter([])
         self.closed = False
@@ -97,13 +152,49 @@ class DictReader:
         self.quotechar = quotechar
         self.footer = footer
         self.first_run = True
+        self.connections = connections
+        self.range_size = range_size
+        self.pool = None
+        ranges = None
+        if connections > 1:
+            ranges = supports_ranges(self.session, self.url_path)
+        if ranges is not None:
+            size, encoding = ranges
+            adapter = HTTPAdapter(pool_connections=1, pool_maxsize=connections)
+            self.session.mount("http://", adapter)
+            self.session.mount("https://", adapter)
+            self.pool = ThreadPoolExecutor(connections)
+            self.fp_iter = decode_lines(self.iter_ranges(size), encoding)
+            return
         try:
             self.file = self.session.get(self.url_path, stream=True)
         except requests.exceptions.MissingSchema:
             raise NotFoundError(f"Can not find URL {self.url_path}")
         if self.file.status_code != 200:
             raise requests.HTTPError(f"Can not download csv file from {self.url_path}")
-        self.fp_iter = self.file.iter_lines(decode_unicode=True)
+        encoding = get_encoding_from_headers(self.file.headers) or "utf-8"
+        self.fp_iter = decode_lines(self.file.iter_content(CHUNK_SIZE), encoding)
+
+    def fetch_range(self, start: int, end: int) -> bytes:
+        """Download bytes [``start``; ``end``] of file"""
+        response = self.session.get(self.url_path, headers={"Range": f"bytes={start}-{end}"})
+        if response.status_code != 206 or len(response.content) != end - start + 1:
+            raise requests.HTTPError(f"Can not download bytes {start}-{end} of csv file from {self.url_path}")
+        return response.content
+
+    def iter_ranges(self, size: int):
+        """Download file by concurrent range requests and return parts in order
+
+        At most 2 * ``connections`` parts downloaded ahead of consumer.
+        Lines split over parts are joined back by ``iter_block_lines``.
+        """
+        ranges = ((start, min(start + self.range_size, size) - 1) for start in range(0, size, self.range_size))
+        pending = deque(self.pool.submit(self.fetch_range, *r) for r in islice(ranges, 2 * self.connections))
+        while pending:
+            data = pending.popleft().result()
+            for r in islice(ranges, 1):
+                pending.append(self.pool.submit(self.fetch_range, *r))
+            yield data
 
     def preparatory_work(self):
         self.lines = skip_line(self.fp_iter, self.start_position, self.footer)
@@ -140,6 +231,8 @@ class DictReader:
         if self.closed:
             raise OSError(f"Connection {self.url_path!r} already closed")
         self.closed = True
+        if self.pool is not None:
+            self.pool.shutdown(wait=True, cancel_futures=True)
         self.session.close()
 
     def __enter__(self):
@@ -0,0 +1,70 @@
+import gzip
+import io
+
+import pytest
+
+from lesson_01.line_index import LineIndex, build_index
+from lesson_01.task_5.main import wc
+from lesson_01.utils import count_file, iter_blocks, iter_records_backward
+
+
+@pytest.mark.parametrize("data, lines", [
+    (b"", 0),
+    (b"a", 1),
+    (b"a\nb\nc", 3),
+    (b"a\nb\nc\n", 3),
+    (b"\n\n", 2),
+])
+def test_wc_counts_last_line_without_newline(tmp_path, data, lines):
+    path = tmp_path / "file.txt"
+    path.write_bytes(data)
+    assert wc(str(path)) == lines
+    assert wc(str(path), workers=2, block_size=1) == lines
+    gz_path = tmp_path / "file.txt.gz"
+    gz_path.write_bytes(gzip.compress(data))
+    assert wc(str(gz_path)) == lines
+
+
+def test_count_file_counts_newlines_as_gnu_wc(tmp_path):
+    path = tmp_path / "file.txt"
+    path.write_bytes(b"a\nb\nc")
+    assert count_file(str(path)).lines == 2
+    assert count_file(str(path), workers=2, block_size=1).lines == 2
+    assert count_file(str(path), workers=2, block_size=1, partial_line=True).lines == 3
+
+
+@pytest.mark.parametrize("data", [b"a\nb\nc", b"a\nb\nc\n", b"a", b""])
+def test_wc_with_and_without_line_index(tmp_path, data):
+    path = tmp_path / "file.txt"
+    path.write_bytes(data)
+    without_index = wc(str(path))
+    build_index(str(path))
+    index = LineIndex.load(str(path))
+    assert index is not None
+    index.close()
+    assert wc(str(path)) == without_index == len(data.splitlines())
+
+
+def test_iter_blocks_start(tmp_path):
+    path = tmp_path / "file.txt"
+    path.write_bytes(b"0123456789")
+    with open(path, "rb") as f:
+        f.read(3)
+        assert b"".join(iter_blocks(f, block_size=4)) == b"3456789"
+        assert b"".join(iter_blocks(f, start=0, block_size=4)) == b"0123456789"
+        assert b"".join(iter_blocks(f, start=2, end=5, block_size=2)) == b"234"
+
+
+@pytest.mark.parametrize("block_size", [1, 2, 3, 4, 5, 64])
+@pytest.mark.parametrize("data, separator, expected", [
+    (b"axxxb", b"xx", b"baxxx"),
+    (b"axxxxb", b"xx", b"bxxaxx"),
+    (b"axxxbxxxxxc", b"xx", b"cxxbxxxaxxx"),
+    (b"axxxbxxxxxc", b"xxx", b"cbxxxxxaxxx"),
+    (b"ababab", b"aba", b"bababa"),
+    (b"a\nb\n", b"\n", b"b\na\n"),
+    (b"a\nb", b"\n", b"ba\n"),
+])
+def test_iter_records_backward_overlapping_separator_as_gnu_tac(block_size, data, separator, expected):
+    records = iter_records_backward(io.BytesIO(data), separator, block_size)
+    assert b"".join(records) == expected
@@ -0,0 +1,50 @@
+import io
+
+import pytest
+
+from lesson_02.tasks.task_1 import csv2columns, csv2dict
+from lesson_02.tasks.task_3 import Csv2Dict, ParallelCsv2Dict
+
+
+def test_csv2dict_footer_keeps_line_ends_inside_quoted_fields(tmp_path):
+    path = tmp_path / "data.csv"
+    path.write_bytes(b'a,b\r\n1,"x\r\ny"\r\n2,z\r\ntotal,2\r\n')
+    with open(path, newline="") as f:
+        rows = list(csv2dict(f, footer=1))
+    assert rows == [{"a": "1", "b": "x\r\ny"}, {"a": "2", "b": "z"}]
+
+
+@pytest.mark.parametrize("footer", [0, 1, 3, 5])
+def test_csv2dict_footer_of_string_stream(footer):
+    data = "a,b\n1,x\n2,y\n3,z\n"
+    rows = list(csv2dict(io.StringIO(data), footer=footer))
+    assert rows == list(csv2dict(data.splitlines(keepends=True)[:max(4 - footer, 0)]))
+
+
+def test_csv2columns_as_numpy_typed_columns():
+    numpy = pytest.importorskip("numpy")
+    data = "id,flag,price,name\n" + "".join("%d,%s,%d.25,n%d\n" % (i, i % 2 == 1, i, i) for i in range(5)) + "5,,,x\n"
+    batches = [{name: column.copy() for name, column in batch.items()}
+               for batch in csv2columns(io.StringIO(data), batch_size=4, as_numpy=True)]
+    assert [len(batch["id"]) for batch in batches] == [4, 2]
+    first, last = batches
+    assert first["id"].dtype == numpy.int64 and first["id"].tolist() == [0, 1, 2, 3]
+    assert first["flag"].dtype == bool and first["flag"].tolist() == [False, True, False, True]
+    assert first["price"].dtype == numpy.float64 and first["price"].tolist() == [0.25, 1.25, 2.25, 3.25]
+    assert first["name"].dtype == object
+    # bool column with null value cannot be stored as dtype bool, float column stores it as NaN
+    assert last["flag"].dtype == object and last["flag"].tolist() == [False, None]
+    assert numpy.isnan(last["price"][1])
+
+
+@pytest.mark.parametrize("start_position", range(6))
+def test_parallel_csv2dict_start_position(tmp_path, start_position):
+    path = tmp_path / "data.csv"
+    path.write_text('a,b\n1,"x\ny"\n2,"p\nq"\n3,z\n')
+    if start_position in (2, 4):
+        with pytest.raises(ValueError):
+            ParallelCsv2Dict(str(path), start_position=start_position)
+        return
+    with open(path, newline="") as f:
+        expected = list(Csv2Dict(f, start_position=start_position))
+    assert list(ParallelCsv2Dict(str(path), start_position=start_position, workers=1, chunk_size=4)) == expected
@@ -0,0 +1,64 @@
+from decimal import Decimal
+
+import pytest
+
+from lesson_03.tasks.task_1 import Count, Sequence
+from lesson_03.tasks.task_3 import (cast_many_bool, cast_many_float, cast_many_int, cast_many_number, cast_to_bool,
+                                    cast_to_float, cast_to_int, cast_to_number)
+
+
+@pytest.mark.parametrize("counter", [
+    Count(start=2, step=3),
+    Sequence(start=2, step=3, cache=2),
+    Sequence(start=1.5, step=0.5, cache=3),
+])
+def test_curval_is_next_value(counter):
+    for _ in range(7):
+        curval = counter.curval
+        assert counter.nextval == curval
+
+
+def test_sequence_lastval():
+    sequence = Sequence(start=10, cache=2)
+    assert sequence.lastval is None
+    values = [next(sequence) for _ in range(3)]
+    assert values == [10, 11, 12] and sequence.lastval == 12
+
+
+def test_cast_many_int_as_numpy_out_of_int64_range():
+    numpy = pytest.importorskip("numpy")
+    result = cast_many_int(["1", "2"], as_numpy=True)
+    assert result.values.dtype == numpy.int64 and result.values.tolist() == [1, 2]
+    result = cast_many_int(["1", str(2 ** 70)], as_numpy=True)
+    assert result.values.dtype == object and result.values.tolist() == [1, 2 ** 70]
+    assert not result.errors
+    result = cast_many_int(["1", "x", "1" + "0" * 400], as_numpy=True)
+    assert result.values[0] == 1 and result.values[2] == 10 ** 400
+    assert list(result.errors) == [1]
+
+
+# Results of casts before fast paths: constructors accept more than the original patterns
+@pytest.mark.parametrize("cast, many, value, expected", [
+    (cast_to_int, cast_many_int, "1 2", 1),
+    (cast_to_int, cast_many_int, "1_000", 1),
+    (cast_to_int, cast_many_int, " -7\t", -7),
+    (cast_to_int, cast_many_int, "١٢", ValueError),
+    (cast_to_float, cast_many_float, "nan", ValueError),
+    (cast_to_float, cast_many_float, "inf", ValueError),
+    (cast_to_float, cast_many_float, "Infinity", ValueError),
+    (cast_to_float, cast_many_float, "1.5e3", 1.5),
+    (cast_to_float, cast_many_float, " -1.25 ", -1.25),
+    (cast_to_number, cast_many_number, "nan", ValueError),
+    (cast_to_number, cast_many_number, "1.5e3", Decimal("1.5")),
+    (cast_to_bool, cast_many_bool, "t r u e", ValueError),
+    (cast_to_bool, cast_many_bool, " TruE ", True),
+])
+def test_casts_keep_original_grammar(cast, many, value, expected):
+    result = many([value, value])
+    if expected is ValueError:
+        with pytest.raises(ValueError):
+            cast(value)
+        assert result.values == [None, None] and list(result.errors) == [0, 1]
+    else:
+        assert cast(value) == expected
+        assert result == ([expected, expected], {})
@@ -0,0 +1,53 @@
+import pytest
+
+from lesson_04.tasks.task_3 import CachedCastType, IntCastType
+from lesson_04.tasks.task_4 import ExtendedMapping, record_class
+
+
+@pytest.mark.parametrize("field", ["items", "values", "keys", "get", "__len__", "_asdict", "_x", "1a", "class"])
+def test_record_class_rejects_reserved_fields(field):
+    with pytest.raises(ValueError, match=field):
+        record_class("Row", ["a", field])
+
+
+def test_record_class_mapping_interface():
+    Row = record_class("Row", ["a", "b"])
+    row = Row(1, 2)
+    assert dict(row.items()) == {"a": 1, "b": 2}
+    assert row.get("b") == 2 and row.a == 1
+
+
+def test_extended_mapping_validates_keys_once(monkeypatch):
+    em = ExtendedMapping({"a": {"b": {"c": 1}}, "f": 4, "n": None, "items": 5})
+    assert not hasattr(em, "__dict__")
+    assert not em._cache
+    assert em.f == 4 and em["items"] == 5 and callable(em.items) and em.n is None
+    assert em._cache == {"f": 4, "items": 5, "n": None}
+    # cached keys are not validated again
+    monkeypatch.setattr(ExtendedMapping, "check_key", None)
+    assert em.f == 4 and em["n"] is None
+    monkeypatch.undo()
+    assert em.a.b.c == 1 and em.a is em["a"]
+    with pytest.raises(AttributeError):
+        em.z
+    with pytest.raises(ValueError):
+        ExtendedMapping({"2key": 1})["2key"]
+    with pytest.raises(ValueError):
+        em[["unhashable"]]
+
+
+def test_cached_cast_type_lfu_evicts_least_frequently_used():
+    caster = CachedCastType(IntCastType(), maxsize=3, policy="lfu")
+    for value in ["1", "1", "1", "2", "2", "3", "3", "4"]:
+        assert caster(value) == int(value)
+    # "2" and "3" were hit once, "2" earlier, so "4" evicted "2"
+    assert set(caster._cache) == {"1", "3", "4"}
+    caster("5")
+    assert set(caster._cache) == {"1", "3", "5"}
+    assert caster.stats.hits == 4 and caster.stats.misses == 5
+
+
+def test_record_class_field_named_self():
+    Row = record_class("Row", ["self", "cls", "name"])
+    row = Row(1, 2, name=3)
+    assert row.self == 1 and row["cls"] == 2 and row._asdict() == {"self": 1, "cls": 2, "name": 3}
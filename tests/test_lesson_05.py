@@ -0,0 +1,102 @@
+import csv
+import io
+import re
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from lesson_05.tasks.task_1 import DictReader
+
+REMOTE_CSV = ('id,text\r\n1,plain\r\n2,"multi\nline"\r\n3,"crlf\r\ninside"\r\n4,"é, ü"\r\n' * 20).encode("utf-8")
+
+
+class RangeHandler(BaseHTTPRequestHandler):
+    """Serve ``REMOTE_CSV`` with support of HTTP Range requests"""
+
+    def do_HEAD(self):
+        self.send_body(REMOTE_CSV, 200, head=True)
+
+    def do_GET(self):
+        match = re.fullmatch(r"bytes=(\d+)-(\d+)", self.headers.get("Range", ""))
+        if match is None:
+            self.send_body(REMOTE_CSV, 200)
+            return
+        start, end = int(match.group(1)), int(match.group(2))
+        self.send_body(REMOTE_CSV[start:end + 1], 206, f"bytes {start}-{end}/{len(REMOTE_CSV)}")
+
+    def send_body(self, body: bytes, status: int, content_range: str = None, head: bool = False):
+        self.send_response(status)
+        self.send_header("Accept-Ranges", "bytes")
+        self.send_header("Content-Type", "text/csv; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        if content_range:
+            self.send_header("Content-Range", content_range)
+        self.end_headers()
+        if not head:
+            self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def csv_url():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), RangeHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield "http://127.0.0.1:%d/data.csv" % server.server_address[1]
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.mark.parametrize("newline", ["\n", "\r\n", "\r"])
+@pytest.mark.parametrize("prefetch", [None, "blocks", "rows"])
+def test_dict_reader_tracked_offsets_split_lines_as_text_mode(tmp_path, newline, prefetch):
+    path = tmp_path / "data.csv"
+    rows = [["a", "b"], ["1", "x"], ["2", "multi\nline"], ["3", "lone\rcr"], ["4", ""]]
+    path.write_bytes("".join(",".join('"%s"' % value for value in row) + newline for row in rows).encode("utf-8"))
+    with DictReader(str(path), encoding="utf-8", prefetch=prefetch, block_size=5) as reader:
+        expected = list(reader)
+    with DictReader(str(path), encoding="utf-8", prefetch=prefetch, block_size=5, track_offsets=True) as reader:
+        assert list(reader) == expected
+    assert len(expected) == 4
+
+
+def test_dict_reader_resumes_from_checkpoint(tmp_path):
+    path = tmp_path / "data.csv"
+    path.write_text("a,b\n" + "".join("%d,%d\n" % (i, i * i) for i in range(10)), encoding="utf-8")
+    with DictReader(str(path), encoding="utf-8", track_offsets=True) as reader:
+        head = [next(reader) for _ in range(4)]
+        checkpoint = reader.checkpoint()
+    with DictReader(str(path), encoding="utf-8", checkpoint=checkpoint) as reader:
+        tail = list(reader)
+    assert [row["a"] for row in head + tail] == [str(i) for i in range(10)]
+
+
+def test_dict_reader_checkpoint_requires_tracked_offsets(tmp_path):
+    path = tmp_path / "data.csv"
+    path.write_text("a,b\n1,2\n", encoding="utf-8")
+    with DictReader(str(path)) as reader:
+        next(reader)
+        with pytest.raises(ValueError):
+            reader.checkpoint()
+
+
+@pytest.mark.parametrize("options", [{}, {"start_position": 2, "header": False, "footer": 1}])
+def test_remote_dict_reader_range_and_single_stream_modes(csv_url, options):
+    pytest.importorskip("requests")
+    from lesson_05.tasks.task_2 import DictReader as RemoteDictReader
+
+    lines = io.StringIO(REMOTE_CSV.decode("utf-8"), newline="").readlines()
+    lines = lines[options.get("start_position", 0):len(lines) - options.get("footer", 0)]
+    expected = list(csv.reader(lines))
+    if options.get("header", True):
+        expected = expected[1:]
+    with RemoteDictReader(csv_url, **options) as reader:
+        single = [list(row.values()) for row in reader]
+    with RemoteDictReader(csv_url, connections=3, range_size=7, **options) as reader:
+        assert reader.pool is not None
+        ranges = [list(row.values()) for row in reader]
+    assert single == ranges == expected
+    assert ["2", "multi\nline"] in single and ["3", "crlf\r\ninside"] in single